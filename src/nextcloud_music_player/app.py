@@ -14,6 +14,7 @@ import toga
 from toga.style import Pack
 from toga.style.pack import COLUMN, ROW
 import asyncio
+import inspect
 import os
 from pathlib import Path
 import tempfile
@@ -44,7 +45,8 @@ class NextCloudMusicPlayer(toga.App):
             app_name="nextcloud-music-player",
             description="A cross-platform music player with NextCloud integration",
             author="Your Name",
-            version="0.1.0"
+            version="0.1.0",
+            on_exit=self.on_app_exit
         )
 
     def startup(self):
@@ -143,12 +145,21 @@ class NextCloudMusicPlayer(toga.App):
             self.logger.error(f"日志系统设置失败，使用基本配置: {e}")
 
 
+    def on_app_exit(self, app, **kwargs):
+        """退出前写回尚未保存的播放列表修改"""
+        try:
+            view_manager = getattr(self, 'view_manager', None)
+            if view_manager is not None:
+                # 播放列表管理器的延迟写盘任务在退出后不会再执行，这里同步写入
+                view_manager.playback_view.playlist_manager.flush_pending_save()
+        except Exception as e:
+            self.logger.error(f"退出时保存播放列表失败: {e}")
+        return True
+
     def add_background_task(self, task):
         """添加后台任务到主线程."""
         try:
             # 尝试使用 asyncio 事件循环调度到主线程
-            import asyncio
-            import inspect
             try:
                 loop = asyncio.get_event_loop()
                 if loop.is_running():
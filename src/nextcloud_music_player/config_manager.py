@@ -4,12 +4,18 @@
 
 import json
 import os
+import tempfile
+from datetime import datetime
 from pathlib import Path
 from typing import Dict, Any, Optional
 import logging
 
 logger = logging.getLogger(__name__)
 
+# 进程的 umask，导入时读取一次（os.umask 只能通过设置来读取）
+_UMASK = os.umask(0)
+os.umask(_UMASK)
+
 def _serialize_for_json(obj):
     """将对象序列化为JSON兼容格式"""
     if isinstance(obj, Path):
@@ -441,27 +447,54 @@ class ConfigManager:
         
         return default_data
 
-    def save_playlists(self, playlists_data: Dict[str, Any]) -> None:
-        """保存播放列表缓存"""
+    def snapshot_playlists(self, playlists_data: Dict[str, Any]) -> Dict[str, Any]:
+        """生成可直接写入文件的播放列表快照（复制容器并序列化 Path 对象，记录保存时间）"""
+        snapshot = _serialize_for_json(playlists_data)
+        snapshot["last_updated"] = datetime.now().isoformat()
+        return snapshot
+
+    def save_playlists(self, playlists_data: Dict[str, Any]) -> bool:
+        """保存播放列表缓存，返回是否保存成功"""
         try:
-            from datetime import datetime
-            # 更新保存时间
-            playlists_data["last_updated"] = datetime.now().isoformat()
-            
-            # 序列化所有Path对象
-            serialized_data = _serialize_for_json(playlists_data)
-            
+            snapshot = self.snapshot_playlists(playlists_data)
+        except Exception as e:
+            logger.error(f"序列化播放列表缓存失败: {e}")
+            return False
+        return self.save_playlists_snapshot(snapshot)
+
+    def save_playlists_snapshot(self, snapshot: Dict[str, Any]) -> bool:
+        """写入 snapshot_playlists 生成的快照，返回是否保存成功"""
+        tmp_path = None
+        try:
+            # 先写入临时文件再替换，避免读取方看到写了一半的文件；
+            # 每次使用独立的临时文件，多个写入方同时保存时不会互相覆盖
             playlist_file = self.config_dir / "playlists.json"
-            with open(playlist_file, 'w', encoding='utf-8') as f:
-                json.dump(serialized_data, f, indent=2, ensure_ascii=False)
+            with tempfile.NamedTemporaryFile('w', encoding='utf-8', dir=self.config_dir,
+                                             prefix='playlists.', suffix='.json.tmp',
+                                             delete=False) as f:
+                tmp_path = f.name
+                json.dump(snapshot, f, indent=2, ensure_ascii=False)
+            # 临时文件默认只有所有者可读写，替换前恢复为原文件（或按 umask 新建文件）的权限
+            try:
+                mode = os.stat(playlist_file).st_mode & 0o777
+            except OSError:
+                mode = 0o666 & ~_UMASK
+            os.chmod(tmp_path, mode)
+            os.replace(tmp_path, playlist_file)
             logger.info("播放列表缓存已保存")
+            return True
         except Exception as e:
             logger.error(f"保存播放列表缓存失败: {e}")
+            if tmp_path is not None:
+                try:
+                    os.remove(tmp_path)
+                except OSError:
+                    pass
+            return False
 
     def add_playlist(self, name: str, songs: list, folder_path: str = "") -> int:
         """添加新的播放列表"""
         try:
-            from datetime import datetime
             playlists_data = self.load_playlists()
             
             # 创建新播放列表
@@ -505,7 +538,6 @@ class ConfigManager:
     def update_playlist_play_info(self, playlist_id: int) -> None:
         """更新播放列表的播放信息"""
         try:
-            from datetime import datetime
             playlists_data = self.load_playlists()
             
             for playlist in playlists_data["playlists"]:
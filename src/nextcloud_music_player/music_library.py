@@ -4,14 +4,18 @@ Music library management for the NextCloud Music Player.
 
 import os
 import json
+import time
 import logging
 from datetime import datetime
 from pathlib import Path
-from typing import Dict, List, Optional
+from typing import Dict, List, Optional, Tuple
 from .config_manager import ConfigManager
 
 logger = logging.getLogger(__name__)
 
+# 文件存在性检查结果的有效期（秒）
+_EXISTS_CACHE_TTL = 5.0
+
 
 class MusicLibrary:
     """Manages the local music library with metadata support."""
@@ -19,6 +23,10 @@ class MusicLibrary:
     def __init__(self):
         """Initialize the music library."""
         self.songs: Dict[str, Dict] = {}  # song_name -> song_info mapping
+        # filepath -> (检查时间, 是否存在)，避免短时间内重复 stat
+        self._exists_cache: Dict[str, Tuple[float, bool]] = {}
+        # music_list.json 上次读写时的 (修改时间, 大小)，用于判断是否需要重新加载
+        self._music_list_stamp: Optional[Tuple[int, int]] = None
 
         # 使用ConfigManager来获取配置目录
         config_manager = ConfigManager()
@@ -82,8 +90,20 @@ class MusicLibrary:
             self.songs[song_name]['is_downloaded'] = True
             self.songs[song_name]['filepath'] = local_path
             self.songs[song_name]['download_time'] = datetime.now().isoformat()
+            self._exists_cache[str(local_path)] = (time.monotonic(), True)
             self.save_music_list()
 
+    def _file_exists(self, filepath: str) -> bool:
+        """Check whether a file exists, reusing recent results."""
+        filepath = str(filepath)
+        now = time.monotonic()
+        cached = self._exists_cache.get(filepath)
+        if cached is not None and now - cached[0] < _EXISTS_CACHE_TTL:
+            return cached[1]
+        exists = os.path.exists(filepath)
+        self._exists_cache[filepath] = (now, exists)
+        return exists
+
     def is_song_downloaded(self, song_name: str) -> bool:
         """Check if a song is downloaded locally."""
         song = self.get_song_info(song_name)
@@ -95,7 +115,7 @@ class MusicLibrary:
         filepath = song.get('filepath')
         logger.info(f"Checking download status for song: {song_name}")
 
-        if is_downloaded and filepath and os.path.exists(filepath):
+        if is_downloaded and filepath and self._file_exists(filepath):
             logger.info(f"Song '{song_name}' is downloaded.")
             return True
         
@@ -103,7 +123,7 @@ class MusicLibrary:
             filepath = str(self.music_dir / song_name)
             logger.info(f"Using default music directory for song: {filepath}")
 
-        if filepath and os.path.exists(filepath):
+        if filepath and self._file_exists(filepath):
             logger.info(f"Song '{song_name}' is now marked as downloaded.")
             self.songs[song_name]['filepath'] = filepath
             self.songs[song_name]['is_downloaded'] = True
@@ -128,8 +148,10 @@ class MusicLibrary:
         song=self.songs.get(song_name)
         if not song:
             logger.info(f"Song '{song_name}' not found in library.")
-            self.load_music_list()
-            song=self.songs.get(song_name)
+            # 只有文件在外部被修改过才重新解析
+            if self._get_music_list_stamp() != self._music_list_stamp:
+                self.load_music_list()
+                song=self.songs.get(song_name)
         return song 
 
     def extract_song_info_from_filename(self, filename: str) -> Dict:
@@ -159,6 +181,9 @@ class MusicLibrary:
     def remove_song(self, song_name: str) -> None:
         """Remove a song from the library."""
         if song_name in self.songs:
+            filepath = self.songs[song_name].get('filepath')
+            if filepath:
+                self._exists_cache.pop(str(filepath), None)
             del self.songs[song_name]
             self.save_music_list()
 
@@ -224,11 +249,13 @@ class MusicLibrary:
     def clear(self) -> None:
         """Clear all songs from the library."""
         self.songs.clear()
+        self._exists_cache.clear()
         self.save_music_list()
 
     def clear_cache(self) -> None:
         """Clear the library cache and reset."""
         self.songs.clear()
+        self._exists_cache.clear()
         # 删除音乐列表文件
         if self.music_list_file.exists():
             try:
@@ -295,12 +322,22 @@ class MusicLibrary:
 
             with open(self.music_list_file, 'w', encoding='utf-8') as f:
                 json.dump(music_data, f, ensure_ascii=False, indent=2)
+            self._music_list_stamp = self._get_music_list_stamp()
         except Exception as e:
             logger.error(f"Failed to save music list: {e}")
 
+    def _get_music_list_stamp(self) -> Optional[Tuple[int, int]]:
+        """获取 music_list.json 的 (修改时间, 大小)，文件不存在时返回 None"""
+        try:
+            stat = os.stat(self.music_list_file)
+            return (stat.st_mtime_ns, stat.st_size)
+        except OSError:
+            return None
+
     def load_music_list(self) -> None:
         """Load the music list from file."""
         try:
+            self._music_list_stamp = self._get_music_list_stamp()
             if self.music_list_file.exists():
                 with open(self.music_list_file, 'r', encoding='utf-8') as f:
                     data = json.load(f)
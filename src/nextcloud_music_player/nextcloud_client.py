@@ -510,10 +510,13 @@ class NextCloudClient:
                     if content:
                         logger.info(f"✅ [NC_DOWNLOAD] 方法 {method.__name__} 成功，内容大小: {len(content)} bytes")
                         
-                        # 保存到缓存目录
-                        cached_path.parent.mkdir(parents=True, exist_ok=True)
-                        with open(cached_path, 'wb') as f:
-                            f.write(content)
+                        # 保存到缓存目录 - 在线程池中写入，避免阻塞事件循环
+                        def _sync_save():
+                            cached_path.parent.mkdir(parents=True, exist_ok=True)
+                            with open(cached_path, 'wb') as f:
+                                f.write(content)
+                        
+                        await asyncio.get_event_loop().run_in_executor(None, _sync_save)
                         
                         logger.debug(f"💾 [NC_DOWNLOAD] 文件已保存到缓存: {cached_path}")
                       
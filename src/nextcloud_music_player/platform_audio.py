@@ -5,14 +5,21 @@
 import sys
 import logging
 import os
+import time
 from typing import Optional, Protocol
 from pathlib import Path
 
 logger = logging.getLogger(__name__)
 
+# 运行平台在进程生命周期内不会改变，导入时判断一次
+_IS_IOS = sys.platform == 'ios' or 'iOS' in str(sys.platform)
+
+# 无法获取时长的文件多久后再重新尝试解析（秒）
+_DURATION_RETRY_INTERVAL = 30.0
+
 def is_ios() -> bool:
     """检测是否运行在iOS平台"""
-    return sys.platform == 'ios' or 'iOS' in str(sys.platform)
+    return _IS_IOS
 
 def is_macos() -> bool:
     """检测是否运行在macOS平台"""
@@ -74,6 +81,8 @@ class PygameAudioPlayer:
         self._pause_time = None
         self._seek_offset = 0.0
         self._cached_duration = None
+        # 时长获取失败后允许再次尝试的时间（time.monotonic）
+        self._duration_retry_at = 0.0
         self._init_pygame()
     
     def _init_pygame(self):
@@ -87,7 +96,7 @@ class PygameAudioPlayer:
         except ImportError:
             logger.error("pygame未安装，无法使用pygame音频播放器")
         except Exception as e:
-            logger.error(f"初始化pygame失败: {e}")
+            logger.error("初始化pygame失败: %s", e)
     
     def load(self, file_path: str) -> bool:
         """加载音频文件"""
@@ -96,7 +105,7 @@ class PygameAudioPlayer:
         
         try:
             if not os.path.exists(file_path):
-                logger.error(f"音频文件不存在: {file_path}")
+                logger.error("音频文件不存在: %s", file_path)
                 return False
             
             self._pygame.mixer.music.load(file_path)
@@ -110,10 +119,10 @@ class PygameAudioPlayer:
             # 清除缓存的时长，确保重新计算
             self._cached_duration = None
             
-            logger.info(f"音频文件加载成功: {file_path}")
+            logger.info("音频文件加载成功: %s", file_path)
             return True
         except Exception as e:
-            logger.error(f"加载音频文件失败: {e}")
+            logger.error("加载音频文件失败: %s", e)
             return False
     
     def play(self) -> bool:
@@ -122,7 +131,6 @@ class PygameAudioPlayer:
             return False
         
         try:
-            import time
             if self._is_paused:
                 self._pygame.mixer.music.unpause()
                 self._is_paused = False
@@ -139,7 +147,7 @@ class PygameAudioPlayer:
             logger.info("开始播放音频")
             return True
         except Exception as e:
-            logger.error(f"播放音频失败: {e}")
+            logger.error("播放音频失败: %s", e)
             return False
     
     def pause(self) -> bool:
@@ -148,7 +156,6 @@ class PygameAudioPlayer:
             return False
         
         try:
-            import time
             self._pygame.mixer.music.pause()
             self._is_paused = True
             # 记录暂停时间
@@ -156,7 +163,7 @@ class PygameAudioPlayer:
             logger.info("暂停播放")
             return True
         except Exception as e:
-            logger.error(f"暂停播放失败: {e}")
+            logger.error("暂停播放失败: %s", e)
             return False
     
     def stop(self) -> bool:
@@ -174,7 +181,7 @@ class PygameAudioPlayer:
             logger.info("停止播放")
             return True
         except Exception as e:
-            logger.error(f"停止播放失败: {e}")
+            logger.error("停止播放失败: %s", e)
             return False
     
     def is_playing(self) -> bool:
@@ -197,7 +204,7 @@ class PygameAudioPlayer:
             self._pygame.mixer.music.set_volume(self._volume)
             return True
         except Exception as e:
-            logger.error(f"设置音量失败: {e}")
+            logger.error("设置音量失败: %s", e)
             return False
     
     def get_duration(self) -> float:
@@ -206,72 +213,76 @@ class PygameAudioPlayer:
             logger.debug("get_duration: 没有当前文件")
             return 0.0
         
+        # 缓存时长，避免重复计算；0.0 表示当前文件获取失败，间隔一段时间后才重试
+        if self._cached_duration is not None:
+            if self._cached_duration > 0 or time.monotonic() < self._duration_retry_at:
+                return self._cached_duration
+        
         if not os.path.exists(self._current_file):
-            logger.debug(f"get_duration: 文件不存在: {self._current_file}")
+            logger.debug("get_duration: 文件不存在: %s", self._current_file)
             return 0.0
         
-        # 缓存时长，避免重复计算
-        if self._cached_duration is not None and self._cached_duration > 0:
-            return self._cached_duration
-        
         try:
             # 尝试使用mutagen库获取音频时长
             try:
                 import mutagen
-                logger.debug(f"尝试使用mutagen获取时长: {self._current_file}")
+                logger.debug("尝试使用mutagen获取时长: %s", self._current_file)
                 audio_file = mutagen.File(self._current_file)
                 if audio_file is not None and hasattr(audio_file, 'info') and hasattr(audio_file.info, 'length'):
                     duration = float(audio_file.info.length)
                     if duration > 0:
-                        logger.info(f"通过mutagen获取音频时长: {duration:.2f}秒")
+                        logger.info("通过mutagen获取音频时长: %.2f秒", duration)
                         self._cached_duration = duration
                         return duration
                     else:
-                        logger.debug(f"mutagen获取的时长无效: {duration}")
+                        logger.debug("mutagen获取的时长无效: %s", duration)
                 else:
                     logger.debug("mutagen无法解析音频文件或没有时长信息")
             except ImportError:
                 logger.debug("mutagen库不可用")
             except Exception as e:
-                logger.debug(f"mutagen获取音频时长失败: {e}")
+                logger.debug("mutagen获取音频时长失败: %s", e)
             
             # 尝试使用wave库（仅支持WAV格式）
             if self._current_file.lower().endswith('.wav'):
                 try:
                     import wave
-                    logger.debug(f"尝试使用wave库获取时长: {self._current_file}")
+                    logger.debug("尝试使用wave库获取时长: %s", self._current_file)
                     with wave.open(self._current_file, 'rb') as wav_file:
                         frames = wav_file.getnframes()
                         sample_rate = wav_file.getframerate()
                         duration = frames / float(sample_rate)
                         if duration > 0:
-                            logger.info(f"通过wave库获取音频时长: {duration:.2f}秒")
+                            logger.info("通过wave库获取音频时长: %.2f秒", duration)
                             self._cached_duration = duration
                             return duration
                 except Exception as e:
-                    logger.debug(f"wave库获取音频时长失败: {e}")
+                    logger.debug("wave库获取音频时长失败: %s", e)
             
             # 尝试使用 eyed3 库（专门用于MP3）
             if self._current_file.lower().endswith('.mp3'):
                 try:
                     import eyed3
-                    logger.debug(f"尝试使用eyed3获取时长: {self._current_file}")
+                    logger.debug("尝试使用eyed3获取时长: %s", self._current_file)
                     audiofile = eyed3.load(self._current_file)
                     if audiofile and audiofile.info and audiofile.info.time_secs:
                         duration = float(audiofile.info.time_secs)
                         if duration > 0:
-                            logger.info(f"通过eyed3获取音频时长: {duration:.2f}秒")
+                            logger.info("通过eyed3获取音频时长: %.2f秒", duration)
                             self._cached_duration = duration
                             return duration
                 except ImportError:
                     logger.debug("eyed3库不可用")
                 except Exception as e:
-                    logger.debug(f"eyed3获取音频时长失败: {e}")
+                    logger.debug("eyed3获取音频时长失败: %s", e)
             
-            logger.warning(f"所有方法都无法获取音频时长: {self._current_file}")
+            logger.warning("所有方法都无法获取音频时长: %s", self._current_file)
+            # 记录失败结果，避免每次刷新进度都重新解析文件
+            self._cached_duration = 0.0
+            self._duration_retry_at = time.monotonic() + _DURATION_RETRY_INTERVAL
             
         except Exception as e:
-            logger.error(f"获取音频时长时发生错误: {e}")
+            logger.error("获取音频时长时发生错误: %s", e)
         
         return 0.0
     
@@ -281,23 +292,21 @@ class PygameAudioPlayer:
             logger.debug("get_position: 没有开始时间，返回 0.0")
             return 0.0
         
-        import time
-        
         if self._is_paused and self._pause_time:
             # 如果暂停，返回暂停时的位置
             position = (self._pause_time - self._start_time) + self._seek_offset
-            logger.debug(f"get_position: 暂停状态，位置 {position:.2f}秒")
+            logger.debug("get_position: 暂停状态，位置 %.2f秒", position)
         else:
             # 如果播放中，计算当前位置
             current_time = time.time()
             position = (current_time - self._start_time) + self._seek_offset
-            logger.debug(f"get_position: 播放状态，位置 {position:.2f}秒")
+            logger.debug("get_position: 播放状态，位置 %.2f秒", position)
         
-        # 确保位置不超过歌曲时长
-        duration = self.get_duration()
+        # 确保位置不超过歌曲时长（只读取已缓存的时长，不在每次刷新时解析文件）
+        duration = self._cached_duration or 0.0
         if duration > 0 and position > duration:
             position = duration
-            logger.debug(f"get_position: 位置超出时长，调整为 {position:.2f}秒")
+            logger.debug("get_position: 位置超出时长，调整为 %.2f秒", position)
         
         # 确保位置不为负数
         if position < 0:
@@ -312,14 +321,12 @@ class PygameAudioPlayer:
             return False
         
         try:
-            import time
-            
             # pygame不支持直接跳转，但可以尝试使用set_pos()
             # 注意：这个功能在某些音频格式上可能不稳定
             if hasattr(self._pygame.mixer.music, 'set_pos'):
                 # set_pos接受秒为单位的位置
                 self._pygame.mixer.music.set_pos(position)
-                logger.info(f"pygame跳转到位置: {position:.2f}秒")
+                logger.info("pygame跳转到位置: %.2f秒", position)
                 
                 # 更新位置跟踪
                 self._start_time = time.time()
@@ -347,11 +354,11 @@ class PygameAudioPlayer:
                     
                     return True
                 except Exception as retry_e:
-                    logger.error(f"pygame重新加载跳转也失败: {retry_e}")
+                    logger.error("pygame重新加载跳转也失败: %s", retry_e)
                     return False
                     
         except Exception as e:
-            logger.error(f"pygame跳转位置失败: {e}")
+            logger.error("pygame跳转位置失败: %s", e)
             return False
 
 class iOSAudioPlayer:
@@ -362,6 +369,9 @@ class iOSAudioPlayer:
         self._current_file = None
         self._volume = 0.7
         self._audio_manager = None
+        # 位置查询的防抖状态
+        self._cached_position = None
+        self._last_position_time = 0.0
         self._init_avfoundation()
     
     def _init_avfoundation(self):
@@ -410,7 +420,7 @@ class iOSAudioPlayer:
                     logger.warning("设置iOS音频会话类别失败")
                     
             except Exception as e:
-                logger.warning(f"配置iOS音频会话失败: {e}")
+                logger.warning("配置iOS音频会话失败: %s", e)
                 # 最后尝试简单方法
                 try:
                     session.setCategory("AVAudioSessionCategoryPlayback", error=None)
@@ -422,9 +432,9 @@ class iOSAudioPlayer:
             logger.info("iOS AVFoundation音频播放器初始化成功")
             
         except ImportError as e:
-            logger.error(f"无法导入AVFoundation: {e}")
+            logger.error("无法导入AVFoundation: %s", e)
         except Exception as e:
-            logger.error(f"初始化iOS音频播放器失败: {e}")
+            logger.error("初始化iOS音频播放器失败: %s", e)
     
     def load(self, file_path: str) -> bool:
         """加载音频文件"""
@@ -436,12 +446,12 @@ class iOSAudioPlayer:
                 file_path_str = str(file_path)
             
             if not os.path.exists(file_path_str):
-                logger.error(f"音频文件不存在: {file_path_str}")
+                logger.error("音频文件不存在: %s", file_path_str)
                 return False
             
             # 创建NSURL - 确保传入字符串
             file_url = self.NSURL.fileURLWithPath(self.NSString.stringWithString(file_path_str))
-            logger.debug(f"iOS load: 创建文件URL: {file_url}")
+            logger.debug("iOS load: 创建文件URL: %s", file_url)
             
             # 创建AVAudioPlayer
             error_ptr = None
@@ -450,27 +460,28 @@ class iOSAudioPlayer:
             if self._player:
                 # 准备播放
                 prepare_success = self._player.prepareToPlay()
-                logger.debug(f"iOS load: prepareToPlay 结果: {prepare_success}")
+                logger.debug("iOS load: prepareToPlay 结果: %s", prepare_success)
                 
                 # 设置音量
                 self._player.setVolume_(self._volume)
                 
                 # 验证加载是否成功
                 duration = self._player.duration  # 这是属性，不是方法
-                logger.info(f"iOS音频文件加载成功: {file_path}, 时长: {duration:.2f}秒")
+                logger.info("iOS音频文件加载成功: %s, 时长: %.2f秒", file_path, duration)
                 
                 self._current_file = file_path
+                self._cached_position = None
                 return True
             else:
-                logger.error(f"无法创建AVAudioPlayer: {file_path}")
+                logger.error("无法创建AVAudioPlayer: %s", file_path)
                 if error_ptr:
-                    logger.error(f"错误详情: {error_ptr}")
+                    logger.error("错误详情: %s", error_ptr)
                 return False
                 
         except Exception as e:
-            logger.error(f"iOS加载音频文件失败: {e}")
+            logger.error("iOS加载音频文件失败: %s", e)
             import traceback
-            logger.error(f"错误堆栈: {traceback.format_exc()}")
+            logger.error("错误堆栈: %s", traceback.format_exc())
             return False
     
     def play(self) -> bool:
@@ -487,7 +498,7 @@ class iOSAudioPlayer:
                 return result
             return False
         except Exception as e:
-            logger.error(f"iOS播放音频失败: {e}")
+            logger.error("iOS播放音频失败: %s", e)
             return False
     
     def pause(self) -> bool:
@@ -499,7 +510,7 @@ class iOSAudioPlayer:
                 return True
             return False
         except Exception as e:
-            logger.error(f"iOS暂停播放失败: {e}")
+            logger.error("iOS暂停播放失败: %s", e)
             return False
     
     def stop(self) -> bool:
@@ -516,7 +527,7 @@ class iOSAudioPlayer:
                 return True
             return False
         except Exception as e:
-            logger.error(f"iOS停止播放失败: {e}")
+            logger.error("iOS停止播放失败: %s", e)
             return False
     
     def is_playing(self) -> bool:
@@ -536,7 +547,7 @@ class iOSAudioPlayer:
                 self._player.setVolume(self._volume)
             return True
         except Exception as e:
-            logger.error(f"iOS设置音量失败: {e}")
+            logger.error("iOS设置音量失败: %s", e)
             return False
     
     def get_duration(self) -> float:
@@ -544,89 +555,74 @@ class iOSAudioPlayer:
         try:
             if self._player:
                 duration = self._player.duration  # 这是属性，不是方法
-                logger.debug(f"iOS get_duration: raw={duration}")
+                logger.debug("iOS get_duration: raw=%s", duration)
                 # 检查是否为有效时长
                 if duration is not None and duration > 0:
                     return float(duration)
                 else:
-                    logger.warning(f"iOS get_duration: 无效时长 {duration}")
+                    logger.warning("iOS get_duration: 无效时长 %s", duration)
                     return 0.0
             logger.debug("iOS get_duration: 没有播放器")
             return 0.0
         except Exception as e:
-            logger.error(f"iOS get_duration 异常: {e}")
+            logger.error("iOS get_duration 异常: %s", e)
             return 0.0
     
     def get_position(self) -> float:
         """获取当前播放位置（秒）"""
         try:
             if self._player:
-                position = self._player.currentTime  # 这是属性，不是方法
-                
                 # iOS特殊处理：添加防抖机制，减少频繁的位置查询导致的卡顿
-                if hasattr(self, '_last_position_time'):
-                    import time
-                    current_time = time.time()
-                    # 如果距离上次查询不到0.1秒，使用缓存值
-                    if current_time - self._last_position_time < 0.1:
-                        if hasattr(self, '_cached_position'):
-                            logger.debug(f"iOS get_position: 使用缓存位置 {self._cached_position:.2f}")
-                            return self._cached_position
+                current_time = time.time()
+                # 如果距离上次查询不到0.1秒，直接使用缓存值，不再访问原生属性
+                if self._cached_position is not None and current_time - self._last_position_time < 0.1:
+                    logger.debug("iOS get_position: 使用缓存位置 %.2f", self._cached_position)
+                    return self._cached_position
+                
+                position = self._player.currentTime  # 这是属性，不是方法
                 
-                logger.debug(f"iOS get_position: raw={position}")
+                logger.debug("iOS get_position: raw=%s", position)
                 
                 # 检查是否为有效位置
                 if position is not None and position >= 0:
                     # 缓存位置和时间
-                    import time
                     self._cached_position = float(position)
-                    self._last_position_time = time.time()
+                    self._last_position_time = current_time
                     return self._cached_position
                 else:
-                    logger.warning(f"iOS get_position: 无效位置 {position}")
+                    logger.warning("iOS get_position: 无效位置 %s", position)
                     return 0.0
             logger.debug("iOS get_position: 没有播放器")
             return 0.0
         except Exception as e:
-            logger.error(f"iOS get_position 异常: {e}")
+            logger.error("iOS get_position 异常: %s", e)
             return 0.0
     
     def seek(self, position: float) -> bool:
         """跳转到指定位置（秒）"""
         try:
             if self._player:
-                # iOS特殊处理：添加防抖机制，避免频繁seek
-                if hasattr(self, '_last_seek_time'):
-                    import time
-                    current_time = time.time()
-                    # 如果距离上次seek不到0.2秒，忽略这次操作
-                    if current_time - self._last_seek_time < 0.2:
-                        logger.debug(f"iOS seek: 忽略频繁的seek操作 {position}")
-                        return True
-                
+                # 频繁跳转由界面层防抖并串行执行，这里不再丢弃跳转请求，
+                # 否则最后一次（用户真正想要的）位置可能被忽略
                 # 在AVAudioPlayer中，currentTime是可读写属性
                 self._player.currentTime = position
-                logger.debug(f"iOS seek: 设置位置为 {position}")
-                
-                # 记录seek时间，用于防抖
-                import time
-                self._last_seek_time = time.time()
+                logger.debug("iOS seek: 设置位置为 %s", position)
                 
                 # 清除位置缓存，强制下次重新获取
-                if hasattr(self, '_cached_position'):
-                    del self._cached_position
-                if hasattr(self, '_last_position_time'):
-                    del self._last_position_time
+                self._cached_position = None
                 
                 return True
             return False
         except Exception as e:
-            logger.error(f"iOS跳转位置失败: {e}")
+            logger.error("iOS跳转位置失败: %s", e)
             return False
 
 class FallbackAudioPlayer:
     """备用音频播放器（使用系统命令）"""
     
+    # 系统命令播放无法查询播放位置
+    supports_position = False
+    
     def __init__(self):
         self._current_file = None
         self._process = None
@@ -635,11 +631,11 @@ class FallbackAudioPlayer:
     def load(self, file_path: str) -> bool:
         """加载音频文件"""
         if not os.path.exists(file_path):
-            logger.error(f"音频文件不存在: {file_path}")
+            logger.error("音频文件不存在: %s", file_path)
             return False
         
         self._current_file = file_path
-        logger.info(f"备用播放器加载文件: {file_path}")
+        logger.info("备用播放器加载文件: %s", file_path)
         return True
     
     def play(self) -> bool:
@@ -661,11 +657,11 @@ class FallbackAudioPlayer:
             
             # 在后台执行
             self._process = subprocess.Popen(cmd, shell=True)
-            logger.info(f"备用播放器开始播放: {self._current_file}")
+            logger.info("备用播放器开始播放: %s", self._current_file)
             return True
             
         except Exception as e:
-            logger.error(f"备用播放器播放失败: {e}")
+            logger.error("备用播放器播放失败: %s", e)
             return False
     
     def pause(self) -> bool:
@@ -683,7 +679,7 @@ class FallbackAudioPlayer:
                 return True
             return False
         except Exception as e:
-            logger.error(f"备用播放器停止失败: {e}")
+            logger.error("备用播放器停止失败: %s", e)
             return False
     
     def is_playing(self) -> bool:
@@ -10,6 +10,9 @@ from datetime import datetime
 
 logger = logging.getLogger(__name__)
 
+# 歌词缓存最多保留的歌曲数
+LYRICS_CACHE_SIZE = 64
+
 
 class LyricLine:
     """歌词行对象"""
@@ -36,6 +39,8 @@ class LyricsService:
         self.current_lyrics = None  # 当前加载的歌词数据
         self.current_song_name = None  # 当前歌曲名称
         self.lyrics_cache = {}  # 歌词缓存
+        # 当前歌词行游标 (歌词行列表, 索引)，播放位置单调前进时只需向后推进
+        self._lyric_cursor = (None, -1)
         
         # LRC时间标签正则表达式 [mm:ss.xx] 或 [mm:ss]
         self.time_pattern = re.compile(r'\[(\d{1,2}):(\d{2})(?:\.(\d{2}))?\]')
@@ -300,6 +305,15 @@ class LyricsService:
     
     def _load_lyrics_from_file(self, song_name: str, lyrics_path: str) -> bool:
         """从文件加载歌词的内部方法"""
+        lyrics_data = self._read_lyrics_file(song_name, lyrics_path)
+        if lyrics_data is not None:
+            self.cache_lyrics(song_name, lyrics_data)
+        self.current_lyrics = lyrics_data
+        self.current_song_name = song_name
+        return lyrics_data is not None
+    
+    def _read_lyrics_file(self, song_name: str, lyrics_path: str) -> Optional[Dict[str, Any]]:
+        """读取并解析歌词文件（不访问缓存和当前歌词状态，可在线程池中调用）"""
         try:
             # 读取歌词文件
             with open(lyrics_path, 'r', encoding='utf-8') as f:
@@ -310,9 +324,7 @@ class LyricsService:
             
             if not lyrics_lines:
                 logger.warning(f"歌词文件为空或格式错误: {lyrics_path}")
-                self.current_lyrics = None
-                self.current_song_name = song_name
-                return False
+                return None
             
             # 创建歌词数据对象
             lyrics_data = {
@@ -322,18 +334,32 @@ class LyricsService:
                 'metadata': metadata,
                 'loaded_at': datetime.now().isoformat()
             }
-            
-            # 缓存歌词数据
-            self.lyrics_cache[song_name] = lyrics_data
-            self.current_lyrics = lyrics_data
-            self.current_song_name = song_name
+
             
             logger.info(f"成功加载歌词: {song_name}, 共 {len(lyrics_lines)} 行")
-            return True
+            return lyrics_data
             
         except Exception as e:
             logger.error(f"从文件加载歌词失败: {lyrics_path}, 错误: {e}")
-            return False
+            return None
+    
+    def read_local_lyrics(self, song_name: str) -> Optional[Dict[str, Any]]:
+        """
+        读取并解析本地歌词文件，不触发下载，也不修改缓存和当前歌词状态
+        
+        Returns:
+            歌词数据，本地没有可用歌词时返回 None
+        """
+        lyrics_path = self.get_lyrics_file_path(song_name)
+        if not lyrics_path:
+            return None
+        return self._read_lyrics_file(song_name, lyrics_path)
+    
+    def cache_lyrics(self, song_name: str, lyrics_data: Dict[str, Any]):
+        """写入歌词缓存（超出上限时淘汰最早加入的条目），应在主线程中调用"""
+        if song_name not in self.lyrics_cache and len(self.lyrics_cache) >= LYRICS_CACHE_SIZE:
+            self.lyrics_cache.pop(next(iter(self.lyrics_cache)), None)
+        self.lyrics_cache[song_name] = lyrics_data
     
     async def _download_and_load_lyrics(self, song_name: str, song_remote_path: str = None):
         """下载并加载歌词的异步方法"""
@@ -373,15 +399,18 @@ class LyricsService:
         
         lyrics_lines = self.current_lyrics['lines']
         
+        # 从上次的位置继续查找；换歌或向前跳转时从头开始
+        cursor_lines, index = self._lyric_cursor
+        if cursor_lines is not lyrics_lines or (index >= 0 and position_seconds < lyrics_lines[index].time_seconds):
+            index = -1
+        
         # 找到当前时间对应的歌词行
-        current_line = None
-        for lyric_line in lyrics_lines:
-            if lyric_line.time_seconds <= position_seconds:
-                current_line = lyric_line
-            else:
-                break
+        line_count = len(lyrics_lines)
+        while index + 1 < line_count and lyrics_lines[index + 1].time_seconds <= position_seconds:
+            index += 1
+        self._lyric_cursor = (lyrics_lines, index)
         
-        return current_line
+        return lyrics_lines[index] if index >= 0 else None
     
     def get_lyrics_around_position(self, position_seconds: float, context_lines: int = 2) -> List[LyricLine]:
         """
@@ -17,6 +17,9 @@ class PlayMode(Enum):
     REPEAT_ALL = "repeat_all"
     SHUFFLE = "shuffle"
 
+# 播放模式字符串到枚举的映射
+PLAY_MODE_BY_NAME = {mode.value: mode for mode in PlayMode}
+
 class PlaybackController:
     """播放控制器 - 负责播放逻辑控制"""
     
@@ -36,12 +39,23 @@ class PlaybackController:
         self.ui_update_callback = ui_update_callback
         self.play_mode = PlayMode.REPEAT_ONE
         
+        # 随机播放顺序（range(n) 的一个排列）及每个索引在其中的位置
+        self._shuffle_order: List[int] = []
+        self._shuffle_pos: List[int] = []
+        
+        # 歌曲结束时按播放模式分派的处理函数，未列出的模式播放下一曲
+        self._auto_next_handlers = {
+            PlayMode.REPEAT_ONE: self._replay_current_song,
+        }
+        
         logger.info("播放控制器初始化完成")
     
     def set_play_mode(self, mode: PlayMode):
         """设置播放模式"""
         self.play_mode = mode
-        logger.info(f"播放模式已设置为: {mode.value}")
+        # 每次进入随机模式时重新洗牌
+        self._shuffle_order = []
+        logger.info("播放模式已设置为: %s", mode.value)
     
     def get_play_mode(self) -> PlayMode:
         """获取当前播放模式"""
@@ -63,7 +77,7 @@ class PlaybackController:
                 if self.ui_update_callback:
                     self.ui_update_callback(True)
         except Exception as e:
-            logger.error(f"切换播放状态失败: {e}")
+            logger.error("切换播放状态失败: %s", e)
             raise
     
     async def resume_music(self):
@@ -74,8 +88,7 @@ class PlaybackController:
                 # 使用播放服务的音频播放器恢复播放
                 if hasattr(self.playback_service, 'audio_player') and self.playback_service.audio_player:
                     if self.playback_service.audio_player.play():
-                        self.playback_service.current_song_state['is_paused'] = False
-                        self.playback_service.current_song_state['is_playing'] = True
+                        self.playback_service.set_play_state(True, False)
                         logger.info("音乐已恢复播放")
                         return
                     else:
@@ -86,14 +99,13 @@ class PlaybackController:
                     import pygame
                     if pygame.mixer.get_init():
                         pygame.mixer.music.unpause()
-                        self.playback_service.current_song_state['is_paused'] = False
-                        self.playback_service.current_song_state['is_playing'] = True
+                        self.playback_service.set_play_state(True, False)
                         logger.info("音乐已恢复播放（pygame）")
                         return
                 except ImportError:
                     logger.warning("pygame不可用")
                 except Exception as pygame_error:
-                    logger.error(f"pygame恢复播放失败: {pygame_error}")
+                    logger.error("pygame恢复播放失败: %s", pygame_error)
             
             # 如果没有暂停的音乐，尝试重新播放当前歌曲
             if hasattr(self.playback_service, 'current_song') and self.playback_service.current_song:
@@ -103,7 +115,7 @@ class PlaybackController:
                 logger.warning("没有可恢复的音乐")
                 
         except Exception as e:
-            logger.error(f"恢复音乐播放失败: {e}")
+            logger.error("恢复音乐播放失败: %s", e)
             raise
     
     async def stop_playback(self):
@@ -115,13 +127,13 @@ class PlaybackController:
             if self.ui_update_callback:
                 self.ui_update_callback(False)
         except Exception as e:
-            logger.error(f"停止播放失败: {e}")
+            logger.error("停止播放失败: %s", e)
             raise
     
     async def previous_song(self):
         """播放上一曲"""
         try:
-            logger.info("开始切换到上一曲")
+            logger.debug("开始切换到上一曲")
             current_playlist = self.playlist_manager.get_current_playlist()
             if not current_playlist or not current_playlist.get("songs"):
                 logger.warning("播放列表为空，无法切换到上一曲")
@@ -141,26 +153,24 @@ class PlaybackController:
             selected_song = songs[new_index]
             if self.play_song_callback:
                 try:
-                    logger.info(f"准备播放上一曲: {selected_song['info'].get('title', '未知')}")
+                    logger.debug("准备播放上一曲: %s", selected_song['info'].get('title', '未知'))
                     await self.play_song_callback(selected_song["info"])
-                    logger.info(f"已切换到上一曲: {selected_song['info'].get('title', '未知')}")
+                    logger.info("已切换到上一曲: %s", selected_song['info'].get('title', '未知'))
                 except Exception as callback_error:
-                    logger.error(f"播放回调失败: {callback_error}")
+                    logger.error("播放回调失败: %s", callback_error)
                     # 即使播放失败，也要返回True，因为索引已经更新了
                     return True
             
             return True
             
         except Exception as e:
-            logger.error(f"上一曲失败: {e}")
-            import traceback
-            logger.error(f"详细错误: {traceback.format_exc()}")
+            logger.error("上一曲失败: %s", e, exc_info=True)
             return False
     
     async def next_song(self):
         """播放下一曲"""
         try:
-            logger.info("开始切换到下一曲")
+            logger.debug("开始切换到下一曲")
             current_playlist = self.playlist_manager.get_current_playlist()
             if not current_playlist or not current_playlist.get("songs"):
                 logger.warning("播放列表为空，无法切换到下一曲")
@@ -180,20 +190,18 @@ class PlaybackController:
             selected_song = songs[new_index]
             if self.play_song_callback:
                 try:
-                    logger.info(f"准备播放下一曲: {selected_song['info'].get('title', '未知')}")
+                    logger.debug("准备播放下一曲: %s", selected_song['info'].get('title', '未知'))
                     await self.play_song_callback(selected_song["info"])
-                    logger.info(f"已切换到下一曲: {selected_song['info'].get('title', '未知')}")
+                    logger.info("已切换到下一曲: %s", selected_song['info'].get('title', '未知'))
                 except Exception as callback_error:
-                    logger.error(f"播放回调失败: {callback_error}")
+                    logger.error("播放回调失败: %s", callback_error)
                     # 即使播放失败，也要返回True，因为索引已经更新了
                     return True
             
             return True
             
         except Exception as e:
-            logger.error(f"下一曲失败: {e}")
-            import traceback
-            logger.error(f"详细错误: {traceback.format_exc()}")
+            logger.error("下一曲失败: %s", e, exc_info=True)
             return False
     
     async def auto_play_next_song(self):
@@ -201,42 +209,41 @@ class PlaybackController:
         try:
             logger.info("开始自动播放下一曲逻辑")
             
-            # 根据播放模式决定是否自动播放下一曲
-            if self.play_mode == PlayMode.REPEAT_ONE:
-                # 单曲循环：重新播放当前歌曲
-                logger.info("单曲循环模式：重新播放当前歌曲")
-                current_playlist = self.playlist_manager.get_current_playlist()
-                if current_playlist and current_playlist.get("songs"):
-                    current_index = current_playlist.get("current_index", 0)
-                    songs = current_playlist["songs"]
-                    if 0 <= current_index < len(songs):
-                        selected_song = songs[current_index]
-                        if self.play_song_callback:
-                            await self.play_song_callback(selected_song["info"])
-                        return True
-            else:
-                # 其他模式：播放下一曲
-                logger.info(f"{self.play_mode.value}模式：播放下一曲")
-                return await self.next_song()
-                
-            return False
+            # 根据播放模式分派：单曲循环重播当前歌曲，其他模式播放下一曲
+            handler = self._auto_next_handlers.get(self.play_mode, self._advance_to_next_song)
+            return await handler()
             
         except Exception as e:
-            logger.error(f"自动播放下一曲失败: {e}")
+            logger.error("自动播放下一曲失败: %s", e)
             return False
     
+    async def _replay_current_song(self) -> bool:
+        """单曲循环：重新播放当前歌曲"""
+        logger.info("单曲循环模式：重新播放当前歌曲")
+        current_playlist = self.playlist_manager.get_current_playlist()
+        if current_playlist and current_playlist.get("songs"):
+            current_index = current_playlist.get("current_index", 0)
+            songs = current_playlist["songs"]
+            if 0 <= current_index < len(songs):
+                selected_song = songs[current_index]
+                if self.play_song_callback:
+                    await self.play_song_callback(selected_song["info"])
+                return True
+        return False
+    
+    async def _advance_to_next_song(self) -> bool:
+        """顺序/列表循环/随机模式：播放下一曲"""
+        logger.info("%s模式：播放下一曲", self.play_mode.value)
+        return await self.next_song()
+    
     def _calculate_previous_index(self, current_index: int, total_songs: int) -> int:
         """计算上一首歌曲的索引"""
         if total_songs == 0:
             return 0
             
         if self.play_mode == PlayMode.SHUFFLE:
-            # 随机模式：随机选择一首（排除当前）
-            available_indices = [i for i in range(total_songs) if i != current_index]
-            if available_indices:
-                return random.choice(available_indices)
-            else:
-                return current_index
+            # 随机模式：按洗牌顺序后退一首
+            return self._shuffle_step(current_index, total_songs, -1)
         else:
             # 顺序模式：上一首
             return (current_index - 1) % total_songs
@@ -247,12 +254,8 @@ class PlaybackController:
             return 0
             
         if self.play_mode == PlayMode.SHUFFLE:
-            # 随机模式：随机选择一首（排除当前）
-            available_indices = [i for i in range(total_songs) if i != current_index]
-            if available_indices:
-                return random.choice(available_indices)
-            else:
-                return current_index
+            # 随机模式：按洗牌顺序前进一首
+            return self._shuffle_step(current_index, total_songs, 1)
         elif self.play_mode == PlayMode.REPEAT_ONE:
             # 单曲循环：保持当前歌曲（在手动切换时仍然切换到下一首）
             return (current_index + 1) % total_songs
@@ -260,6 +263,23 @@ class PlaybackController:
             # 顺序播放或列表循环
             return (current_index + 1) % total_songs
     
+    def _shuffle_step(self, current_index: int, total_songs: int, step: int) -> int:
+        """在洗牌顺序中从当前歌曲移动 step 首，歌曲数变化时重新洗牌"""
+        if len(self._shuffle_order) != total_songs:
+            order = list(range(total_songs))
+            random.shuffle(order)
+            shuffle_pos = [0] * total_songs
+            for pos, index in enumerate(order):
+                shuffle_pos[index] = pos
+            self._shuffle_order = order
+            self._shuffle_pos = shuffle_pos
+        
+        if not 0 <= current_index < total_songs:
+            return self._shuffle_order[0]
+        
+        pos = (self._shuffle_pos[current_index] + step) % total_songs
+        return self._shuffle_order[pos]
+    
     def get_current_song_info(self) -> Optional[Dict[str, Any]]:
         """获取当前歌曲信息"""
         try:
@@ -276,7 +296,7 @@ class PlaybackController:
             return None
             
         except Exception as e:
-            logger.error(f"获取当前歌曲信息失败: {e}")
+            logger.error("获取当前歌曲信息失败: %s", e)
             return None
     
     def get_playlist_info(self) -> Dict[str, Any]:
@@ -305,7 +325,7 @@ class PlaybackController:
             }
             
         except Exception as e:
-            logger.error(f"获取播放列表信息失败: {e}")
+            logger.error("获取播放列表信息失败: %s", e)
             return {
                 "total_songs": 0,
                 "current_index": 0,
@@ -333,12 +353,12 @@ class PlaybackController:
                 if self.play_song_callback:
                     await self.play_song_callback(selected_song["info"])
                 
-                logger.info(f"已播放索引 {index} 的歌曲: {selected_song['info'].get('title', '未知')}")
+                logger.info("已播放索引 %s 的歌曲: %s", index, selected_song['info'].get('title', '未知'))
                 return True
             else:
-                logger.warning(f"歌曲索引 {index} 超出范围（总共 {len(songs)} 首歌曲）")
+                logger.warning("歌曲索引 %s 超出范围（总共 %s 首歌曲）", index, len(songs))
                 return False
                 
         except Exception as e:
-            logger.error(f"根据索引播放歌曲失败: {e}")
+            logger.error("根据索引播放歌曲失败: %s", e)
             return False
@@ -49,6 +49,9 @@ class PlaybackService:
         self.current_song = None
         self.current_playlist_data = None
         self.current_song_info = None
+        # 播放列表数据缓存，以文件修改时间和大小校验，避免重复读取解析JSON
+        self._playlists_cache = None
+        self._playlists_file_stamp = None
         self.current_song_state = {
             'is_playing': False,
             'is_paused': False,
@@ -58,6 +61,9 @@ class PlaybackService:
             'last_played': None
         }
         
+        # 播放/暂停状态变化监听器，参数为 (is_playing, is_paused)
+        self._state_listeners: List[Callable[[bool, bool], None]] = []
+        
         # 播放状态回调
         self._pause_music_callback = None
         self._stop_music_callback = None
@@ -138,17 +144,67 @@ class PlaybackService:
         self._set_play_mode_callback = set_play_mode_callback
         
     
+    def add_state_listener(self, listener: Callable[[bool, bool], None]):
+        """注册播放/暂停状态变化监听器"""
+        if listener not in self._state_listeners:
+            self._state_listeners.append(listener)
+    
+    def remove_state_listener(self, listener: Callable[[bool, bool], None]):
+        """移除播放/暂停状态变化监听器"""
+        if listener in self._state_listeners:
+            self._state_listeners.remove(listener)
+    
+    def set_play_state(self, is_playing: bool, is_paused: bool):
+        """更新播放/暂停状态，状态变化时通知监听器"""
+        state = self.current_song_state
+        if state['is_playing'] == is_playing and state['is_paused'] == is_paused:
+            return
+        state['is_playing'] = is_playing
+        state['is_paused'] = is_paused
+        for listener in list(self._state_listeners):
+            try:
+                listener(is_playing, is_paused)
+            except Exception as e:
+                logger.error(f"播放状态监听器执行失败: {e}")
+    
+    def _get_playlists_file_stamp(self):
+        """获取播放列表文件的 (修改时间, 大小)，文件不存在时返回 None"""
+        try:
+            stat = os.stat(self.config_manager.config_dir / "playlists.json")
+            return (stat.st_mtime_ns, stat.st_size)
+        except OSError:
+            return None
+    
     def load_playlists(self) -> Dict[str, Any]:
-        """加载播放列表数据"""
-        return self.config_manager.load_playlists()
+        """加载播放列表数据 - 文件未被修改时直接返回缓存
+        
+        返回的是共享的缓存对象，修改后需通过 save_playlists 保存。
+        """
+        stamp = self._get_playlists_file_stamp()
+        if self._playlists_cache is not None and stamp is not None and stamp == self._playlists_file_stamp:
+            return self._playlists_cache
+        
+        playlists_data = self.config_manager.load_playlists()
+        self._playlists_cache = playlists_data
+        self._playlists_file_stamp = self._get_playlists_file_stamp()
+        return playlists_data
     
     def save_playlists(self, playlists_data: Dict[str, Any]):
-        """保存播放列表数据"""
-        self.config_manager.save_playlists(playlists_data)
+        """保存播放列表数据，保存成功后用已保存的数据更新缓存"""
+        if self.config_manager.save_playlists(playlists_data):
+            self._playlists_cache = playlists_data
+            self._playlists_file_stamp = self._get_playlists_file_stamp()
+        else:
+            # 未写入的数据不能留在缓存中，下次加载时重新读取文件
+            self._playlists_cache = None
+            self._playlists_file_stamp = None
     
     def get_playlist_by_id(self, playlist_id: str) -> Optional[Dict[str, Any]]:
-        """根据ID获取播放列表"""
-        return self.config_manager.get_playlist_by_id(playlist_id)
+        """根据ID获取播放列表 - 走带缓存的 load_playlists，避免每次重新解析文件"""
+        for playlist in self.load_playlists().get("playlists", []):
+            if playlist.get("id") == playlist_id:
+                return playlist
+        return None
     
     def get_song_info(self, song_name: str) -> Optional[Dict[str, Any]]:
         """获取歌曲信息"""
@@ -196,8 +252,7 @@ class PlaybackService:
                 if self.current_song_state['is_paused']:
                     success = self.audio_player.play()
                     if success:
-                        self.current_song_state['is_paused'] = False
-                        self.current_song_state['is_playing'] = True
+                        self.set_play_state(True, False)
                         logger.info("恢复播放音乐")
                     return
                 
@@ -212,8 +267,7 @@ class PlaybackService:
                         self.audio_player.stop()
                         await asyncio.sleep(0.1)  # 短暂等待确保停止完成
                         # 重置播放状态
-                        self.current_song_state['is_playing'] = False
-                        self.current_song_state['is_paused'] = False
+                        self.set_play_state(False, False)
                         
                     # 重新加载文件
                     logger.info("重新加载音频文件")
@@ -228,8 +282,7 @@ class PlaybackService:
                         
                         if play_success:
                             # 更新播放状态
-                            self.current_song_state['is_playing'] = True
-                            self.current_song_state['is_paused'] = False
+                            self.set_play_state(True, False)
                             self.current_song_state['last_played'] = datetime.now().isoformat()
                             logger.info("播放状态已更新")
                             
@@ -265,8 +318,7 @@ class PlaybackService:
                     
                     if self.audio_player and self.audio_player.load(self.current_song):
                         if self.audio_player.play():
-                            self.current_song_state['is_playing'] = True
-                            self.current_song_state['is_paused'] = False
+                            self.set_play_state(True, False)
                             self.current_song_state['last_played'] = datetime.now().isoformat()
                             logger.info("重新初始化播放器后播放成功")
                             return
@@ -281,8 +333,7 @@ class PlaybackService:
             # 如果当前暂停状态，恢复播放
             if self.current_song_state['is_paused']:
                 pygame.mixer.music.unpause()
-                self.current_song_state['is_paused'] = False
-                self.current_song_state['is_playing'] = True
+                self.set_play_state(True, False)
                 logger.info("恢复播放音乐")
                 return
             
@@ -292,8 +343,7 @@ class PlaybackService:
             pygame.mixer.music.play()
             
             # 更新播放状态
-            self.current_song_state['is_playing'] = True
-            self.current_song_state['is_paused'] = False
+            self.set_play_state(True, False)
             self.current_song_state['last_played'] = datetime.now().isoformat()
             
             logger.info(f"开始播放: {os.path.basename(self.current_song)}")
@@ -470,8 +520,7 @@ class PlaybackService:
             # 使用新的平台音频播放器
             if self.audio_player and self.current_song_state['is_playing'] and not self.current_song_state['is_paused']:
                 if self.audio_player.pause():
-                    self.current_song_state['is_paused'] = True
-                    self.current_song_state['is_playing'] = False
+                    self.set_play_state(False, True)
                     logger.info("音乐已暂停")
                     return
                 else:
@@ -483,8 +532,7 @@ class PlaybackService:
                 
             if self.current_song_state['is_playing'] and not self.current_song_state['is_paused']:
                 pygame.mixer.music.pause()
-                self.current_song_state['is_paused'] = True
-                self.current_song_state['is_playing'] = False
+                self.set_play_state(False, True)
                 logger.info("音乐已暂停")
         except Exception as e:
             logger.error(f"暂停音乐失败: {e}")
@@ -501,8 +549,7 @@ class PlaybackService:
             # 使用新的平台音频播放器
             if self.audio_player and (self.current_song_state['is_playing'] or self.current_song_state['is_paused']):
                 if self.audio_player.stop():
-                    self.current_song_state['is_playing'] = False
-                    self.current_song_state['is_paused'] = False
+                    self.set_play_state(False, False)
                     self.current_song_state['position'] = 0
                     logger.info("音乐已停止")
                     return
@@ -515,8 +562,7 @@ class PlaybackService:
                 
             if self.current_song_state['is_playing'] or self.current_song_state['is_paused']:
                 pygame.mixer.music.stop()
-                self.current_song_state['is_playing'] = False
-                self.current_song_state['is_paused'] = False
+                self.set_play_state(False, False)
                 self.current_song_state['position'] = 0
                 logger.info("音乐已停止")
         except Exception as e:
@@ -540,15 +586,9 @@ class PlaybackService:
             
         # 从配置文件加载
         try:
-            from ..views.playback_view import PlayMode
+            from .playback_controller import PLAY_MODE_BY_NAME, PlayMode
             mode_string = self.config_manager.get("player.play_mode", "repeat_one")
-            mode_map = {
-                "normal": PlayMode.NORMAL,
-                "repeat_one": PlayMode.REPEAT_ONE,
-                "repeat_all": PlayMode.REPEAT_ALL,
-                "shuffle": PlayMode.SHUFFLE
-            }
-            self._current_play_mode = mode_map.get(mode_string, PlayMode.REPEAT_ONE)
+            self._current_play_mode = PLAY_MODE_BY_NAME.get(mode_string, PlayMode.REPEAT_ONE)
             logger.debug(f"从配置加载播放模式: {mode_string}")
             return self._current_play_mode
         except Exception as e:
@@ -563,9 +603,8 @@ class PlaybackService:
                 is_audio_playing = self.audio_player.is_playing()
                 # 同步内部状态
                 if is_audio_playing != self.current_song_state['is_playing']:
-                    self.current_song_state['is_playing'] = is_audio_playing
-                    if is_audio_playing:
-                        self.current_song_state['is_paused'] = False
+                    self.set_play_state(is_audio_playing,
+                                         False if is_audio_playing else self.current_song_state['is_paused'])
                 return is_audio_playing
             
             # 备用方案：使用内部状态和pygame验证
@@ -575,7 +614,7 @@ class PlaybackService:
                     pygame_playing = pygame.mixer.music.get_busy()
                     if not pygame_playing and not self.current_song_state['is_paused']:
                         # pygame显示未播放且未暂停，更新状态
-                        self.current_song_state['is_playing'] = False
+                        self.set_play_state(False, False)
                         return False
                 return True
                 
@@ -638,6 +677,10 @@ class PlaybackService:
             logger.error(f"跳转到指定位置失败: {e}")
             return False
     
+    async def seek_to_position_async(self, position: float) -> bool:
+        """可等待的跳转 - 原生播放器不是线程安全的，跳转保持在事件循环线程中执行"""
+        return self.seek_to_position(position)
+    
     def get_duration(self) -> float:
         """获取音频总时长"""
         try:
@@ -674,18 +717,11 @@ class PlaybackService:
         """通过字符串设置播放模式"""
         # 导入播放模式枚举
         try:
-            from ..views.playback_view import PlayMode
-            
-            # 模式映射
-            mode_map = {
-                "normal": PlayMode.NORMAL,
-                "repeat_one": PlayMode.REPEAT_ONE,
-                "repeat_all": PlayMode.REPEAT_ALL,
-                "shuffle": PlayMode.SHUFFLE
-            }
+            from .playback_controller import PLAY_MODE_BY_NAME
             
-            if mode_string in mode_map:
-                self.set_play_mode(mode_map[mode_string])
+            play_mode = PLAY_MODE_BY_NAME.get(mode_string)
+            if play_mode is not None:
+                self.set_play_mode(play_mode)
                 
                 # 保存播放模式到配置
                 self.config_manager.set("player.play_mode", mode_string)
@@ -715,7 +751,7 @@ class PlaybackService:
                 # 更新存储的状态
                 self.current_song_state['position'] = position
                 self.current_song_state['duration'] = duration
-                self.current_song_state['is_playing'] = is_playing
+                self.set_play_state(is_playing, self.current_song_state.get('is_paused', False))
                 
                 return {
                     'position': position,
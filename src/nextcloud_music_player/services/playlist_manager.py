@@ -5,12 +5,37 @@
 
 import os
 import json
+import asyncio
 import logging
+import threading
 from typing import Optional, Dict, List, Any
 from datetime import datetime
 
 logger = logging.getLogger(__name__)
 
+# 播放列表写盘的防抖延迟（秒）
+_SAVE_DEBOUNCE_DELAY = 0.5
+
+# 新建播放列表时的默认字段
+_PLAYLIST_TEMPLATE = {
+    "last_played": None,
+    "play_count": 0,
+    "current_index": 0
+}
+
+
+def _build_song_entry(song_info: Dict[str, Any], song_name: str = None) -> Dict[str, Any]:
+    """创建播放列表中的歌曲条目"""
+    return {
+        "name": song_info.get('name', '') if song_name is None else song_name,
+        "info": song_info,
+        "state": {
+            "play_count": 0,
+            "is_favorite": False,
+            "last_played": None
+        }
+    }
+
 class PlaylistManager:
     """播放列表管理器 - 负责播放列表的生命周期管理"""
     
@@ -28,6 +53,19 @@ class PlaylistManager:
         # 缓存当前播放列表数据
         self._current_playlist_cache = None
         self._playlists_cache = None
+        # 歌曲名 -> 索引映射: (songs列表, 构建时的修改计数, 映射)
+        self._name_index = None
+        # 播放列表ID -> 索引映射: (playlists列表, 映射)
+        self._playlist_index = None
+        # 播放列表数据的修改计数，每次保存或重新加载时递增，供界面判断是否需要刷新
+        self.change_version = 0
+        
+        # 延迟保存状态：数据版本号高于已写入版本时表示有未保存的修改，
+        # 同时保证旧快照不会覆盖新数据
+        self._save_task = None
+        self._data_version = 0
+        self._saved_version = 0
+        self._save_lock = threading.Lock()
         
     def load_playlists_data(self) -> Dict[str, Any]:
         """加载所有播放列表数据（带缓存）"""
@@ -36,14 +74,91 @@ class PlaylistManager:
         return self._playlists_cache
     
     def save_playlists_data(self, playlists_data: Dict[str, Any]):
-        """保存播放列表数据并更新缓存"""
-        self.config_manager.save_playlists(playlists_data)
+        """更新缓存并安排保存（事件循环中合并延迟写盘）"""
         self._playlists_cache = playlists_data
+        self.change_version += 1
+        self._schedule_save()
+    
+    def _has_unsaved_changes(self) -> bool:
+        """是否有尚未成功写盘的修改"""
+        return self._playlists_cache is not None and self._saved_version < self._data_version
+    
+    def _schedule_save(self):
+        """标记数据已修改，在事件循环中延迟合并写入，否则立即写入"""
+        self._data_version += 1
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            self.flush_pending_save()
+            return
+        if self._save_task is None or self._save_task.done():
+            self._save_task = loop.create_task(self._debounced_save())
+    
+    async def _debounced_save(self):
+        """等待修改合并后，在线程池中写入播放列表文件"""
+        await asyncio.sleep(_SAVE_DEBOUNCE_DELAY)
+        loop = asyncio.get_running_loop()
+        while self._has_unsaved_changes():
+            # 在主线程中取快照，避免写盘线程读取正在修改的数据；
+            # 只复制字典和列表容器（其余均为不可变值），比 deepcopy 快得多
+            version = self._data_version
+            snapshot = self.config_manager.snapshot_playlists(self._playlists_cache)
+            if not await loop.run_in_executor(None, self._write_playlists, snapshot, version):
+                # 写入失败时保留未保存状态，由下一次保存或退出时的 flush 重试
+                break
+    
+    def _write_playlists(self, snapshot: Dict[str, Any], version: int) -> bool:
+        """写入播放列表文件，跳过比已写入版本更旧的数据；返回数据是否已在磁盘上"""
+        with self._save_lock:
+            if version <= self._saved_version:
+                return True
+            if self.config_manager.save_playlists_snapshot(snapshot):
+                self._saved_version = version
+                return True
+            return False
+    
+    def flush_pending_save(self):
+        """立即写入尚未保存的播放列表数据"""
+        if self._has_unsaved_changes():
+            snapshot = self.config_manager.snapshot_playlists(self._playlists_cache)
+            self._write_playlists(snapshot, self._data_version)
         
     def invalidate_cache(self):
         """清除缓存，强制重新加载"""
+        # 重新加载前先写入未保存的修改
+        self.flush_pending_save()
+        self.change_version += 1
         self._playlists_cache = None
         self._current_playlist_cache = None
+        self._name_index = None
+        self._playlist_index = None
+    
+    def _find_playlist_index(self, playlists: List[Dict[str, Any]], playlist_id) -> Optional[int]:
+        """按ID查找播放列表索引，映射过期（列表被替换或重排）时重新构建"""
+        cached = self._playlist_index
+        if cached is not None and cached[0] is playlists:
+            index = cached[1].get(playlist_id)
+            if index is not None and index < len(playlists) and playlists[index].get("id") == playlist_id:
+                return index
+        
+        id_index = {}
+        for i, playlist in enumerate(playlists):
+            id_index.setdefault(playlist.get("id"), i)
+        self._playlist_index = (playlists, id_index)
+        return id_index.get(playlist_id)
+    
+    def _get_name_index(self, playlist: Dict[str, Any]) -> Dict[str, int]:
+        """获取播放列表中歌曲名到索引的映射，列表被替换或数据被修改后重新构建"""
+        songs = playlist.setdefault('songs', [])
+        cached = self._name_index
+        if cached is not None and cached[0] is songs and cached[1] == self.change_version:
+            return cached[2]
+        
+        name_index = {}
+        for i, song_entry in enumerate(songs):
+            name_index.setdefault(song_entry.get('name', ''), i)
+        self._name_index = (songs, self.change_version, name_index)
+        return name_index
         
     def get_current_playlist_id(self) -> Optional[int]:
         """获取当前播放列表ID"""
@@ -71,11 +186,9 @@ class PlaylistManager:
     
     def get_playlist_by_id(self, playlist_id: int) -> Optional[Dict[str, Any]]:
         """根据ID获取播放列表"""
-        playlists_data = self.load_playlists_data()
-        for playlist in playlists_data.get("playlists", []):
-            if playlist.get("id") == playlist_id:
-                return playlist
-        return None
+        playlists = self.load_playlists_data().get("playlists", [])
+        index = self._find_playlist_index(playlists, playlist_id)
+        return playlists[index] if index is not None else None
     
     def create_default_playlist_if_needed(self) -> Dict[str, Any]:
         """如果没有当前播放列表，创建默认播放列表"""
@@ -101,6 +214,12 @@ class PlaylistManager:
     
     def create_empty_playlist(self, name: str = "新播放列表", folder_path: str = "") -> Dict[str, Any]:
         """创建空的播放列表"""
+        new_playlist = self._insert_new_playlist(name, [], folder_path)
+        logger.info(f"创建新播放列表: {name} (ID: {new_playlist['id']})")
+        return new_playlist
+    
+    def _insert_new_playlist(self, name: str, songs: List[Dict[str, Any]], folder_path: str) -> Dict[str, Any]:
+        """创建新播放列表，插入到列表开头并设为当前播放列表"""
         playlists_data = self.load_playlists_data()
         
         # 生成新ID
@@ -110,12 +229,10 @@ class PlaylistManager:
         new_playlist = {
             "id": next_id,
             "name": name,
-            "songs": [],
+            "songs": songs,
             "folder_path": folder_path,
             "created_at": datetime.now().isoformat(),
-            "last_played": None,
-            "play_count": 0,
-            "current_index": 0
+            **_PLAYLIST_TEMPLATE
         }
         
         # 添加到播放列表数组
@@ -128,8 +245,6 @@ class PlaylistManager:
         
         # 更新缓存
         self._current_playlist_cache = new_playlist
-        
-        logger.info(f"创建新播放列表: {name} (ID: {next_id})")
         return new_playlist
     
     def create_playlist_from_folder(self, folder_path: str, name: str = None) -> Dict[str, Any]:
@@ -145,50 +260,19 @@ class PlaylistManager:
                 music_list = self.music_service.load_music_list()
                 
                 # 筛选属于该文件夹的歌曲
-                for song_info in music_list:
-                    song_folder = song_info.get('folder_path', '')
-                    if song_folder == folder_path:
-                        song_entry = {
-                            "name": song_info.get('name', ''),
-                            "info": song_info,
-                            "state": {
-                                "play_count": 0,
-                                "is_favorite": False,
-                                "last_played": None
-                            }
-                        }
-                        songs.append(song_entry)
-                        
+                songs = [
+                    _build_song_entry(song_info)
+                    for song_info in music_list
+                    if song_info.get('folder_path', '') == folder_path
+                ]
+                
             except Exception as e:
                 logger.error(f"从音乐服务获取文件列表失败: {e}")
         
         # 创建播放列表
-        playlists_data = self.load_playlists_data()
-        next_id = playlists_data.get("next_id", 1)
+        new_playlist = self._insert_new_playlist(name, songs, folder_path)
         
-        new_playlist = {
-            "id": next_id,
-            "name": name,
-            "songs": songs,
-            "folder_path": folder_path,
-            "created_at": datetime.now().isoformat(),
-            "last_played": None,
-            "play_count": 0,
-            "current_index": 0
-        }
-        
-        # 添加到播放列表数组
-        playlists_data.setdefault("playlists", []).insert(0, new_playlist)
-        playlists_data["next_id"] = next_id + 1
-        playlists_data["current_playlist_id"] = next_id
-        
-        # 保存数据
-        self.save_playlists_data(playlists_data)
-        
-        # 更新缓存
-        self._current_playlist_cache = new_playlist
-        
-        logger.info(f"从文件夹创建播放列表: {name} (ID: {next_id}, 歌曲数: {len(songs)})")
+        logger.info(f"从文件夹创建播放列表: {name} (ID: {new_playlist['id']}, 歌曲数: {len(songs)})")
         return new_playlist
     
     def add_song_to_current_playlist(self, song_info: Dict[str, Any]) -> bool:
@@ -200,29 +284,23 @@ class PlaylistManager:
             
             # 检查歌曲是否已存在
             song_name = song_info.get('name', '')
-            existing_songs = current_playlist.get('songs', [])
+            name_index = self._get_name_index(current_playlist)
             
-            for existing_song in existing_songs:
-                if existing_song.get('name') == song_name:
-                    logger.info(f"歌曲已存在于播放列表中: {song_name}")
-                    return False
+            if song_name in name_index:
+                logger.info(f"歌曲已存在于播放列表中: {song_name}")
+                return False
             
             # 创建歌曲条目
-            song_entry = {
-                "name": song_name,
-                "info": song_info,
-                "state": {
-                    "play_count": 0,
-                    "is_favorite": False,
-                    "last_played": None
-                }
-            }
+            song_entry = _build_song_entry(song_info, song_name)
             
             # 添加到播放列表
-            current_playlist.setdefault('songs', []).append(song_entry)
+            songs = current_playlist['songs']
+            songs.append(song_entry)
+            name_index[song_name] = len(songs) - 1
             
-            # 保存播放列表
+            # 保存播放列表；映射已同步更新，保存后继续沿用
             self.save_current_playlist(current_playlist)
+            self._name_index = (songs, self.change_version, name_index)
             
             logger.info(f"添加歌曲到播放列表: {song_name}")
             return True
@@ -238,35 +316,26 @@ class PlaylistManager:
             if not current_playlist:
                 current_playlist = self.create_default_playlist_if_needed()
             
-            existing_songs = current_playlist.get('songs', [])
-            existing_names = {song.get('name', '') for song in existing_songs}
-            
-            added_count = 0
+            songs = current_playlist.setdefault('songs', [])
+            existing_names = {song.get('name', '') for song in songs}
+            add_name = existing_names.add
             
-            # 批量添加歌曲
+            # 先收集新条目，最后一次性追加到播放列表
+            new_entries = []
+            append_entry = new_entries.append
             for song_info in song_infos:
                 song_name = song_info.get('name', '')
                 
                 # 检查歌曲是否已存在
                 if song_name in existing_names:
-                    logger.debug(f"歌曲已存在于播放列表中，跳过: {song_name}")
+                    logger.debug("歌曲已存在于播放列表中，跳过: %s", song_name)
                     continue
                 
-                # 创建歌曲条目
-                song_entry = {
-                    "name": song_name,
-                    "info": song_info,
-                    "state": {
-                        "play_count": 0,
-                        "is_favorite": False,
-                        "last_played": None
-                    }
-                }
-                
-                # 添加到播放列表
-                current_playlist.setdefault('songs', []).append(song_entry)
-                existing_names.add(song_name)
-                added_count += 1
+                append_entry(_build_song_entry(song_info, song_name))
+                add_name(song_name)
+            
+            songs.extend(new_entries)
+            added_count = len(new_entries)
             
             # 只保存一次播放列表
             if added_count > 0:
@@ -289,6 +358,7 @@ class PlaylistManager:
             songs = current_playlist.get('songs', [])
             if 0 <= index < len(songs):
                 removed_song = songs.pop(index)
+                self._name_index = None
                 
                 # 调整当前播放索引
                 current_index = current_playlist.get('current_index', 0)
@@ -318,6 +388,7 @@ class PlaylistManager:
             
             current_playlist['songs'] = []
             current_playlist['current_index'] = 0
+            self._name_index = None
             
             # 保存播放列表
             self.save_current_playlist(current_playlist)
@@ -343,10 +414,10 @@ class PlaylistManager:
             playlist_id = playlist_data.get('id')
             
             # 查找并更新对应的播放列表
-            for i, playlist in enumerate(playlists_data.get("playlists", [])):
-                if playlist.get("id") == playlist_id:
-                    playlists_data["playlists"][i] = playlist_data
-                    break
+            playlists = playlists_data.get("playlists", [])
+            index = self._find_playlist_index(playlists, playlist_id)
+            if index is not None:
+                playlists[index] = playlist_data
             
             # 保存数据
             self.save_playlists_data(playlists_data)
@@ -369,25 +440,25 @@ class PlaylistManager:
             playlists = playlists_data.get("playlists", [])
             
             # 查找并删除播放列表
-            for i, playlist in enumerate(playlists):
-                if playlist.get("id") == playlist_id:
-                    deleted_playlist = playlists.pop(i)
-                    
-                    # 如果删除的是当前播放列表，选择新的当前播放列表
-                    if playlists_data.get("current_playlist_id") == playlist_id:
-                        if playlists:
-                            playlists_data["current_playlist_id"] = playlists[0]["id"]
-                        else:
-                            playlists_data["current_playlist_id"] = None
-                        self._current_playlist_cache = None
-                    
-                    # 保存数据
-                    self.save_playlists_data(playlists_data)
-                    
-                    logger.info(f"删除播放列表: {deleted_playlist.get('name', '未知')}")
-                    return True
+            index = self._find_playlist_index(playlists, playlist_id)
+            if index is None:
+                return False
+            deleted_playlist = playlists.pop(index)
+            self._playlist_index = None
             
-            return False
+            # 如果删除的是当前播放列表，选择新的当前播放列表
+            if playlists_data.get("current_playlist_id") == playlist_id:
+                if playlists:
+                    playlists_data["current_playlist_id"] = playlists[0]["id"]
+                else:
+                    playlists_data["current_playlist_id"] = None
+                self._current_playlist_cache = None
+            
+            # 保存数据
+            self.save_playlists_data(playlists_data)
+            
+            logger.info(f"删除播放列表: {deleted_playlist.get('name', '未知')}")
+            return True
             
         except Exception as e:
             logger.error(f"删除播放列表失败: {e}")
@@ -400,17 +471,17 @@ class PlaylistManager:
             if not current_playlist:
                 return False
             
-            songs = current_playlist.get('songs', [])
-            for song_entry in songs:
-                if song_entry.get('name') == song_name:
-                    song_state = song_entry.setdefault('state', {})
-                    song_state.update(state_updates)
-                    
-                    # 保存播放列表
-                    self.save_current_playlist(current_playlist)
-                    return True
+            index = self._get_name_index(current_playlist).get(song_name)
+            if index is None:
+                return False
             
-            return False
+            song_entry = current_playlist['songs'][index]
+            song_state = song_entry.setdefault('state', {})
+            song_state.update(state_updates)
+            
+            # 保存播放列表
+            self.save_current_playlist(current_playlist)
+            return True
             
         except Exception as e:
             logger.error(f"更新歌曲状态失败: {e}")
@@ -35,11 +35,13 @@ class LyricsDisplayComponent:
         self.no_lyrics_label = None
         self.download_button = None  # 添加下载按钮
         self.lyrics_labels = []  # 歌词行标签列表
+        self._highlighted_time = None  # 当前已高亮歌词行的时间点，未变化时跳过样式写入
         
         # 状态
         self.is_visible = True
         self.current_position = 0.0
         self.current_song_name = None
+        self._loading_song_name = None  # 正在异步加载歌词的歌曲
         self.auto_scroll = True  # 是否自动滚动
         
         # 显示设置
@@ -153,7 +155,8 @@ class LyricsDisplayComponent:
             是否成功加载歌词
         """
         try:
-            logger.info(f"加载歌词: {song_name}")
+            logger.info("加载歌词: %s", song_name)
+            self._loading_song_name = song_name
             
             # 清除当前显示
             self.clear_lyrics_display()
@@ -180,29 +183,47 @@ class LyricsDisplayComponent:
                 # 显示所有歌词行
                 self.display_all_lyrics()
                 
-                logger.info(f"成功加载并显示歌词: {song_name}")
+                logger.info("成功加载并显示歌词: %s", song_name)
                 return True
             else:
                 # 显示无歌词状态和下载按钮
                 self.show_no_lyrics_message(song_name)
                 self.download_button.style.visibility = "visible"
-                logger.info(f"未找到歌词文件: {song_name}")
+                logger.info("未找到歌词文件: %s", song_name)
                 return False
                 
         except Exception as e:
-            logger.error(f"加载歌词失败: {song_name}, 错误: {e}")
+            logger.error("加载歌词失败: %s, 错误: %s", song_name, e)
             self.show_no_lyrics_message(song_name, f"加载失败: {str(e)}")
             self.download_button.style.visibility = "visible"
             return False
     
+    async def load_lyrics_for_song_async(self, song_name: str, auto_download: bool = True) -> bool:
+        """在线程池中预读取歌词文件，再在主线程中刷新显示"""
+        self._loading_song_name = song_name
+        if song_name not in self.lyrics_service.lyrics_cache:
+            try:
+                loop = asyncio.get_event_loop()
+                lyrics_data = await loop.run_in_executor(None, self.lyrics_service.read_local_lyrics, song_name)
+                # 缓存只在主线程中修改
+                if lyrics_data is not None:
+                    self.lyrics_service.cache_lyrics(song_name, lyrics_data)
+            except Exception as e:
+                logger.warning("预读取歌词失败: %s, 错误: %s", song_name, e)
+        # 等待期间已开始加载其他歌曲时放弃本次结果
+        if self._loading_song_name != song_name:
+            return False
+        return self.load_lyrics_for_song(song_name, auto_download)
+    
     def clear_lyrics_display(self):
         """清除歌词显示"""
         try:
             self.lyrics_box.clear()
             self.lyrics_labels = []
+            self._highlighted_time = None
             logger.debug("已清除歌词显示")
         except Exception as e:
-            logger.error(f"清除歌词显示失败: {e}")
+            logger.error("清除歌词显示失败: %s", e)
     
     def show_no_lyrics_message(self, song_name: str = None, error_msg: str = None):
         """显示无歌词消息"""
@@ -226,7 +247,7 @@ class LyricsDisplayComponent:
             self.title_label.text = "🎵 歌词"
             
         except Exception as e:
-            logger.error(f"显示无歌词消息失败: {e}")
+            logger.error("显示无歌词消息失败: %s", e)
     
     def add_metadata_display(self, metadata: Dict[str, str]):
         """添加歌词元数据显示"""
@@ -265,7 +286,7 @@ class LyricsDisplayComponent:
                 self.lyrics_box.add(metadata_box)
                 
         except Exception as e:
-            logger.error(f"添加元数据显示失败: {e}")
+            logger.error("添加元数据显示失败: %s", e)
     
     def display_all_lyrics(self):
         """显示所有歌词行"""
@@ -281,10 +302,10 @@ class LyricsDisplayComponent:
                 self.lyrics_box.add(lyric_label)
                 self.lyrics_labels.append(lyric_label)
             
-            logger.debug(f"显示了 {len(lyrics_lines)} 行歌词")
+            logger.debug("显示了 %s 行歌词", len(lyrics_lines))
             
         except Exception as e:
-            logger.error(f"显示歌词失败: {e}")
+            logger.error("显示歌词失败: %s", e)
     
     def create_lyric_label(self, lyric_line: LyricLine, index: int) -> toga.Label:
         """
@@ -339,6 +360,12 @@ class LyricsDisplayComponent:
             # 获取当前歌词行
             current_line = self.lyrics_service.get_current_lyric_line(position_seconds)
             
+            # 当前行未变化时不重新设置样式和滚动
+            line_time = current_line.time_seconds if current_line else None
+            if line_time == self._highlighted_time:
+                return
+            self._highlighted_time = line_time
+            
             # 更新歌词行的高亮状态
             self.update_lyrics_highlight(current_line)
             
@@ -347,7 +374,7 @@ class LyricsDisplayComponent:
                 self.scroll_to_current_line(current_line)
                 
         except Exception as e:
-            logger.error(f"更新歌词位置失败: {e}")
+            logger.error("更新歌词位置失败: %s", e)
     
     def update_lyrics_highlight(self, current_line: Optional[LyricLine]):
         """
@@ -371,7 +398,7 @@ class LyricsDisplayComponent:
                         label.style.background_color = "transparent"
                         
         except Exception as e:
-            logger.error(f"更新歌词高亮失败: {e}")
+            logger.error("更新歌词高亮失败: %s", e)
     
     def scroll_to_current_line(self, current_line: LyricLine):
         """
@@ -392,15 +419,15 @@ class LyricsDisplayComponent:
                 # 这里可以实现滚动到指定标签的逻辑
                 # Toga的ScrollContainer目前可能不直接支持滚动到特定位置
                 # 可以在未来的版本中实现
-                logger.debug(f"滚动到歌词行: {current_line.text}")
+                logger.debug("滚动到歌词行: %s", current_line.text)
                 
         except Exception as e:
-            logger.error(f"滚动到歌词行失败: {e}")
+            logger.error("滚动到歌词行失败: %s", e)
     
     def toggle_auto_scroll(self):
         """切换自动滚动"""
         self.auto_scroll = not self.auto_scroll
-        logger.info(f"自动滚动: {'开启' if self.auto_scroll else '关闭'}")
+        logger.info("自动滚动: %s", '开启' if self.auto_scroll else '关闭')
     
     def set_font_size(self, size: int):
         """
@@ -416,10 +443,10 @@ class LyricsDisplayComponent:
             for label in self.lyrics_labels:
                 label.style.font_size = self.font_size
             
-            logger.info(f"歌词字体大小设置为: {self.font_size}")
+            logger.info("歌词字体大小设置为: %s", self.font_size)
             
         except Exception as e:
-            logger.error(f"设置字体大小失败: {e}")
+            logger.error("设置字体大小失败: %s", e)
     
     def show_lyrics_settings(self, widget):
         """显示歌词设置（暂时未实现）"""
@@ -454,21 +481,21 @@ class LyricsDisplayComponent:
                 # 下载成功，重新加载歌词
                 self.load_lyrics_for_song(self.current_song_name, auto_download=False)
                 self.show_download_status("歌词下载成功！")
-                logger.info(f"手动下载歌词成功: {self.current_song_name}")
+                logger.info("手动下载歌词成功: %s", self.current_song_name)
                 
                 # 3秒后隐藏状态
                 await asyncio.sleep(3)
                 self.hide_download_status()
             else:
                 self.show_download_status("歌词下载失败，可能不存在对应的歌词文件")
-                logger.warning(f"手动下载歌词失败: {self.current_song_name}")
+                logger.warning("手动下载歌词失败: %s", self.current_song_name)
                 
                 # 3秒后隐藏状态
                 await asyncio.sleep(3)
                 self.hide_download_status()
             
         except Exception as e:
-            logger.error(f"手动下载歌词失败: {e}")
+            logger.error("手动下载歌词失败: %s", e)
             self.show_download_status(f"下载失败: {str(e)}")
             await asyncio.sleep(3)
             self.hide_download_status()
@@ -502,7 +529,7 @@ class LyricsDisplayComponent:
                 self.download_status_label.style.visibility = "visible"
                 
         except Exception as e:
-            logger.error(f"显示下载状态失败: {e}")
+            logger.error("显示下载状态失败: %s", e)
     
     def hide_download_status(self):
         """隐藏下载状态信息"""
@@ -510,7 +537,7 @@ class LyricsDisplayComponent:
             if hasattr(self, 'download_status_label'):
                 self.download_status_label.style.visibility = "hidden"
         except Exception as e:
-            logger.error(f"隐藏下载状态失败: {e}")
+            logger.error("隐藏下载状态失败: %s", e)
     
     def set_visibility(self, visible: bool):
         """
@@ -522,9 +549,9 @@ class LyricsDisplayComponent:
         try:
             self.is_visible = visible
             self.container.style.visibility = "visible" if visible else "hidden"
-            logger.debug(f"歌词显示可见性: {visible}")
+            logger.debug("歌词显示可见性: %s", visible)
         except Exception as e:
-            logger.error(f"设置歌词可见性失败: {e}")
+            logger.error("设置歌词可见性失败: %s", e)
     
     def refresh_display(self):
         """刷新歌词显示"""
@@ -535,7 +562,7 @@ class LyricsDisplayComponent:
                 if self.current_position > 0:
                     self.update_lyrics_position(self.current_position)
         except Exception as e:
-            logger.error(f"刷新歌词显示失败: {e}")
+            logger.error("刷新歌词显示失败: %s", e)
     
     def get_service(self) -> LyricsService:
         """获取歌词服务实例"""
@@ -7,7 +7,9 @@ from toga.style import Pack
 from toga.style.pack import COLUMN, ROW
 import asyncio
 import logging
+import time
 from typing import Optional, Callable, Any
+from ...services.playback_controller import PLAY_MODE_BY_NAME
 from ...utils.platform_ui import (
     get_safe_area_bottom_padding, 
     get_button_touch_size, 
@@ -17,6 +19,20 @@ from ...utils.platform_ui import (
 
 logger = logging.getLogger(__name__)
 
+# 拖拽进度条停止多久后执行跳转（秒）
+_SEEK_DEBOUNCE_DELAY = 0.12
+
+# 用户操作进度条后保持高频刷新的时长（秒）
+_INTERACTION_WINDOW = 1.0
+
+# 00-59 的两位数字符串表，格式化时间时直接查表
+_TWO_DIGIT = tuple(f"{i:02d}" for i in range(60))
+
+def _mmss(seconds: int) -> str:
+    """把整数秒格式化为 MM:SS"""
+    minutes, secs = divmod(max(0, seconds), 60)
+    return f"{_TWO_DIGIT[minutes] if minutes < 60 else minutes}:{_TWO_DIGIT[secs]}"
+
 class PlaybackControlComponent:
     """播放控制组件 - 负责播放控制按钮和相关UI"""
     
@@ -36,6 +52,15 @@ class PlaybackControlComponent:
         # 防止重复点击的标志
         self._button_busy = False
         
+        # 上次渲染的按钮状态，未变化时跳过样式写入
+        self._last_mode = None
+        self._last_play_pause_state = None
+        # 上次显示的整数秒，秒数未变化时不重新格式化
+        self._last_cur_sec = -1
+        self._last_dur_sec = -1
+        # 当前歌曲的时长缓存 (歌曲路径, 时长)，避免每次拖拽都调用原生接口
+        self._duration_cache = (None, 0.0)
+        
         # 获取平台相关的UI参数
         self.button_sizes = get_button_touch_size()
         self.paddings = get_control_padding()
@@ -70,10 +95,8 @@ class PlaybackControlComponent:
         # 创建音量和播放模式控制 - 一行式布局
         self.create_compact_volume_and_mode_controls()
         
-        # 添加到主容器 - 紧凑布局顺序
-        self.container.add(self.progress_box)  # 进度条在顶部
-        self.container.add(self.volume_mode_box)  # 音量和模式在中间
-        self.container.add(self.controls_box)  # 播放按钮在底部
+        # 添加到主容器 - 紧凑布局顺序：进度条在顶部，音量和模式在中间，播放按钮在底部
+        self.container.add(self.progress_box, self.volume_mode_box, self.controls_box)
     
     def create_playback_buttons(self):
         """创建播放控制按钮 - 使用相对百分比宽度的响应式设计"""
@@ -145,10 +168,12 @@ class PlaybackControlComponent:
         )
         
         # 添加按钮到容器
-        self.controls_box.add(self.prev_button)
-        self.controls_box.add(self.play_pause_button)
-        self.controls_box.add(self.next_button)
-        self.controls_box.add(self.stop_button)
+        self.controls_box.add(
+            self.prev_button,
+            self.play_pause_button,
+            self.next_button,
+            self.stop_button
+        )
     
     def create_compact_volume_and_mode_controls(self):
         """创建紧凑的音量和播放模式控制 - 使用相对百分比宽度的响应式设计"""
@@ -185,8 +210,7 @@ class PlaybackControlComponent:
             )
         )
         
-        volume_box.add(volume_label)
-        volume_box.add(self.volume_slider)
+        volume_box.add(volume_label, self.volume_slider)
         
         # 播放模式按钮 - 使用flex布局确保所有按钮可见，给更多空间
         mode_box = toga.Box(style=Pack(
@@ -249,121 +273,14 @@ class PlaybackControlComponent:
             )
         )
         
-        mode_box.add(self.normal_button)
-        mode_box.add(self.repeat_one_button)
-        mode_box.add(self.repeat_all_button)
-        mode_box.add(self.shuffle_button)
-        
-        self.volume_mode_box.add(volume_box)
-        self.volume_mode_box.add(mode_box)
-    
-    def create_volume_and_mode_controls(self):
-        """创建音量和播放模式控制"""
-        self.volume_mode_box = toga.Box(style=Pack(
-            direction=COLUMN,
-            padding=5,
-            alignment="center"
-        ))
-        
-        # 音量控制
-        volume_label = toga.Label(
-            "🔊 音量",
-            style=Pack(
-                font_size=12,
-                padding=(0, 0, 2, 0),
-                text_align="center"
-            )
-        )
-        
-        self.volume_slider = toga.Slider(
-            range=(0, 100),
-            value=70,
-            on_change=self._on_volume_change,
-            style=Pack(
-                width=200,
-                padding=(0, 0, 5, 0)
-            )
-        )
-        
-        # 播放模式控制
-        mode_label = toga.Label(
-            "🎵 播放模式",
-            style=Pack(
-                font_size=12,
-                padding=(0, 0, 2, 0),
-                text_align="center"
-            )
-        )
-        
-        # 播放模式按钮行
-        self.mode_buttons_box = toga.Box(style=Pack(
-            direction=ROW,
-            padding=2,
-            alignment="center"
-        ))
-        
-        # 播放模式按钮
-        self.normal_button = toga.Button(
-            "🔁",
-            on_press=lambda widget: self._set_play_mode("normal"),
-            style=Pack(
-                width=40,
-                height=30,
-                padding=(0, 2),
-                font_size=12
-            )
-        )
-        
-        self.repeat_one_button = toga.Button(
-            "🔂",
-            on_press=lambda widget: self._set_play_mode("repeat_one"),
-            style=Pack(
-                width=40,
-                height=30,
-                padding=(0, 2),
-                font_size=12
-            )
-        )
-        
-        self.repeat_all_button = toga.Button(
-            "🔁",
-            on_press=lambda widget: self._set_play_mode("repeat_all"),
-            style=Pack(
-                width=40,
-                height=30,
-                padding=(0, 2),
-                font_size=12
-            )
-        )
-        
-        self.shuffle_button = toga.Button(
-            "🔀",
-            on_press=lambda widget: self._set_play_mode("shuffle"),
-            style=Pack(
-                width=40,
-                height=30,
-                padding=(0, 2),
-                font_size=12
-            )
+        mode_box.add(
+            self.normal_button,
+            self.repeat_one_button,
+            self.repeat_all_button,
+            self.shuffle_button
         )
         
-        # 添加模式按钮到容器
-        self.mode_buttons_box.add(self.normal_button)
-        self.mode_buttons_box.add(self.repeat_one_button)
-        self.mode_buttons_box.add(self.repeat_all_button)
-        self.mode_buttons_box.add(self.shuffle_button)
-        
-        # 添加音量和模式控制到容器
-        self.volume_mode_box.add(volume_label)
-        self.volume_mode_box.add(self.volume_slider)
-        self.volume_mode_box.add(mode_label)
-        self.volume_mode_box.add(self.mode_buttons_box)
-        
-        # 创建进度显示区域
-        self.create_progress_section()
-        
-        # 初始化播放模式按钮状态
-        self.update_mode_buttons()
+        self.volume_mode_box.add(volume_box, mode_box)
     
     def create_progress_section(self):
         """创建播放进度区域 - 使用相对百分比宽度的响应式设计"""
@@ -391,6 +308,8 @@ class PlaybackControlComponent:
             max=100,
             value=0,
             on_change=self._on_seek,
+            on_press=self._on_scrub_start,
+            on_release=self._on_scrub_end,
             style=Pack(
                 flex=1,         # 占据剩余空间，自适应屏幕宽度
                 padding=(0, 8)  # 增加左右间距
@@ -410,11 +329,15 @@ class PlaybackControlComponent:
         
         # 添加防抖控制变量
         self._updating_progress = False  # 标记是否正在程序更新进度条
-        self._last_user_seek_time = 0  # 用户最后一次拖拽时间
-        
-        self.progress_box.add(self.current_time_label)
-        self.progress_box.add(self.progress_slider)
-        self.progress_box.add(self.total_time_label)
+        self._last_progress_int = -1  # 上次写入进度条的整数百分比
+        self._pending_seek_value = None  # 尚未执行的拖拽位置（百分比）
+        self._seek_timer = None  # 拖拽防抖定时器，每次拖拽重新计时
+        self._seek_task = None  # 跳转执行任务（未结束时不再创建新任务）
+        self._scrubbing = False  # 用户是否正按住进度条拖拽
+        self._pending_seek_time = None  # 尚未完成的跳转目标位置（秒），界面优先显示它
+        self._last_interaction_time = 0.0  # 用户最后一次操作进度条的时间（monotonic）
+        
+        self.progress_box.add(self.current_time_label, self.progress_slider, self.total_time_label)
     
     async def _on_previous_song(self, widget):
         """上一曲按钮点击处理"""
@@ -435,22 +358,22 @@ class PlaybackControlComponent:
     async def _safe_button_action(self, action_func, action_name: str):
         """安全的按钮操作，防止重复点击"""
         if self._button_busy:
-            logger.warning(f"按钮操作繁忙，忽略{action_name}操作")
+            logger.warning("按钮操作繁忙，忽略%s操作", action_name)
             return
         
         try:
             self._button_busy = True
-            logger.info(f"执行{action_name}操作")
+            logger.info("执行%s操作", action_name)
             
             result = await action_func()
             
             if result is not None and not result:
-                logger.warning(f"{action_name}操作失败")
+                logger.warning("%s操作失败", action_name)
             else:
-                logger.info(f"{action_name}操作完成")
+                logger.info("%s操作完成", action_name)
                 
         except Exception as e:
-            logger.error(f"{action_name}操作异常: {e}")
+            logger.error("%s操作异常: %s", action_name, e)
         finally:
             self._button_busy = False
     
@@ -458,30 +381,20 @@ class PlaybackControlComponent:
         """音量改变处理"""
         try:
             volume = int(widget.value)
-            logger.info(f"音量调整为: {volume}%")
+            logger.info("音量调整为: %s%%", volume)
             
             # 这里可以调用播放服务设置音量
             # if hasattr(self.playback_controller.playback_service, 'set_volume'):
             #     self.playback_controller.playback_service.set_volume(volume / 100.0)
             
         except Exception as e:
-            logger.error(f"设置音量失败: {e}")
+            logger.error("设置音量失败: %s", e)
     
     def _set_play_mode(self, mode: str):
         """设置播放模式"""
         try:
-            from ...services.playback_controller import PlayMode
-            
             # 将字符串模式转换为枚举
-            mode_enum = None
-            if mode == "normal":
-                mode_enum = PlayMode.NORMAL
-            elif mode == "repeat_one":
-                mode_enum = PlayMode.REPEAT_ONE
-            elif mode == "repeat_all":
-                mode_enum = PlayMode.REPEAT_ALL
-            elif mode == "shuffle":
-                mode_enum = PlayMode.SHUFFLE
+            mode_enum = PLAY_MODE_BY_NAME.get(mode)
             
             if mode_enum:
                 self.playback_controller.set_play_mode(mode_enum)
@@ -491,17 +404,19 @@ class PlaybackControlComponent:
                 if self.on_play_mode_change_callback:
                     self.on_play_mode_change_callback(mode)
                 
-                logger.info(f"播放模式已设置为: {mode}")
+                logger.info("播放模式已设置为: %s", mode)
             else:
-                logger.error(f"未知的播放模式: {mode}")
+                logger.error("未知的播放模式: %s", mode)
                 
         except Exception as e:
-            logger.error(f"设置播放模式失败: {e}")
+            logger.error("设置播放模式失败: %s", e)
     
     def update_mode_buttons(self):
         """更新播放模式按钮状态 - 使用新的颜色样式"""
         try:
             current_mode = self.playback_controller.get_play_mode()
+            if current_mode == self._last_mode:
+                return
             
             # 重置所有按钮样式
             buttons = {
@@ -520,13 +435,18 @@ class PlaybackControlComponent:
                     # 未选中状态 - 浅灰色背景
                     button.style.background_color = "#f8f9fa"
                     button.style.color = "#495057"
+            
+            self._last_mode = current_mode
                     
         except Exception as e:
-            logger.error(f"更新播放模式按钮状态失败: {e}")
+            logger.error("更新播放模式按钮状态失败: %s", e)
     
     def update_play_pause_button(self, is_playing: bool):
         """更新播放/暂停按钮状态 - 包含颜色样式更新"""
         try:
+            if is_playing == self._last_play_pause_state:
+                return
+            
             if is_playing:
                 self.play_pause_button.text = "⏸️"
                 self.play_pause_button.style.background_color = "#ffc107"  # 暂停时黄色
@@ -535,8 +455,9 @@ class PlaybackControlComponent:
                 self.play_pause_button.style.background_color = "#007bff"  # 播放时蓝色
             # 保持白色文字
             self.play_pause_button.style.color = "white"
+            self._last_play_pause_state = is_playing
         except Exception as e:
-            logger.error(f"更新播放/暂停按钮失败: {e}")
+            logger.error("更新播放/暂停按钮失败: %s", e)
     
     def set_volume(self, volume: int):
         """设置音量滑块值"""
@@ -544,46 +465,90 @@ class PlaybackControlComponent:
             if 0 <= volume <= 100:
                 self.volume_slider.value = volume
         except Exception as e:
-            logger.error(f"设置音量滑块失败: {e}")
+            logger.error("设置音量滑块失败: %s", e)
     
     def _on_seek(self, widget):
-        """进度条拖拽处理"""
+        """进度条拖拽处理 - 只记录最新位置，拖拽停止后再执行一次跳转"""
         try:
             # 如果是程序自动更新进度条，直接返回
             if self._updating_progress:
                 logger.debug("程序更新进度条，忽略on_change事件")
                 return
             
-            # 防抖处理
-            import time
-            current_time = time.time()
-            
-            # 检查是否在短时间内多次触发
-            if hasattr(self, '_last_user_seek_time'):
-                time_diff = current_time - self._last_user_seek_time
-                if time_diff < 0.5:  # 0.5秒的防抖间隔
-                    logger.debug(f"忽略频繁的用户进度条拖拽 (间隔: {time_diff:.2f}s)")
-                    return
-            
-            # 记录用户操作时间
-            self._last_user_seek_time = current_time
-            logger.info(f"用户拖拽进度条: {widget.value:.1f}%")
-            
             # 检查是否正在播放
             if not self.playback_controller.playback_service.is_playing():
                 logger.warning("当前没有播放音乐，无法跳转")
                 self.reset_progress_to_current()
                 return
             
+            # 记录最新的拖拽位置，并立即更新时间显示作为反馈
+            self._last_interaction_time = time.monotonic()
+            self._pending_seek_value = widget.value
+            duration = self.get_current_duration()
+            if duration > 0:
+                self._pending_seek_time = (widget.value / 100) * duration
+                self.update_time_display(self._pending_seek_time, duration)
+            
+            # 每次拖拽都重新计时，拖拽停顿后才执行一次跳转
+            if self._seek_timer is not None:
+                self._seek_timer.cancel()
+            self._seek_timer = asyncio.get_event_loop().call_later(_SEEK_DEBOUNCE_DELAY, self._commit_seek)
+                
+        except Exception as e:
+            logger.error("拖拽进度条失败: %s", e)
+    
+    def _on_scrub_start(self, widget):
+        """开始拖拽进度条：拖拽期间不再用播放进度覆盖滑块和时间显示"""
+        self._scrubbing = True
+        self._last_interaction_time = time.monotonic()
+    
+    def _on_scrub_end(self, widget):
+        """结束拖拽进度条：松手即提交跳转，不再等待防抖计时"""
+        self._scrubbing = False
+        self._last_interaction_time = time.monotonic()
+        if self._seek_timer is not None:
+            self._seek_timer.cancel()
+            self._commit_seek()
+    
+    def is_user_interacting(self) -> bool:
+        """用户是否正在或刚刚操作进度条（用于加快界面刷新）"""
+        if self._scrubbing or self._seek_timer is not None:
+            return True
+        if self._seek_task is not None and not self._seek_task.done():
+            return True
+        return time.monotonic() - self._last_interaction_time < _INTERACTION_WINDOW
+    
+    def _commit_seek(self):
+        """拖拽停顿后启动跳转；已有跳转在执行时由它接着处理最新位置"""
+        self._seek_timer = None
+        if self._seek_task is None or self._seek_task.done():
+            self._seek_task = asyncio.get_event_loop().create_task(self._flush_seek())
+    
+    async def _flush_seek(self):
+        """跳转到最后一次拖拽的位置，同一时间只执行一个跳转"""
+        try:
+            # 跳转执行期间的新拖拽只更新待跳转位置，当前跳转完成后立即跳到最新位置
+            while self._pending_seek_value is not None:
+                value, self._pending_seek_value = self._pending_seek_value, None
+                await self._seek_to_percent(value)
+        finally:
+            # 跳转全部完成后恢复使用播放器的实际位置
+            self._pending_seek_time = None
+    
+    async def _seek_to_percent(self, value: float):
+        """跳转到进度条百分比对应的位置"""
+        try:
+            logger.info("用户拖拽进度条: %.1f%%", value)
+            
             # 计算新的播放位置
             duration = self.get_current_duration()
             if duration > 0:
-                new_position = (widget.value / 100) * duration
+                new_position = (value / 100) * duration
                 
                 # 跳转到新位置
-                success = self.playback_controller.playback_service.seek_to_position(new_position)
+                success = await self.playback_controller.playback_service.seek_to_position_async(new_position)
                 if success:
-                    logger.info(f"跳转到位置: {new_position:.2f}秒 ({widget.value:.1f}%)")
+                    logger.info("跳转到位置: %.2f秒 (%.1f%%)", new_position, value)
                     # 立即更新时间显示
                     self.update_time_display(new_position, duration)
                 else:
@@ -594,25 +559,33 @@ class PlaybackControlComponent:
                 self.reset_progress_to_current()
                 
         except Exception as e:
-            logger.error(f"拖拽进度条失败: {e}")
+            logger.error("拖拽进度条失败: %s", e)
     
     def get_current_duration(self):
-        """获取当前歌曲时长"""
+        """获取当前歌曲时长 - 按歌曲缓存，换歌后才重新向播放器查询"""
         try:
-            # 首先尝试从播放器获取
-            if self.playback_controller.playback_service.audio_player:
-                duration = self.playback_controller.playback_service.audio_player.get_duration()
+            service = self.playback_controller.playback_service
+            song = service.current_song
+            cached_song, cached_duration = self._duration_cache
+            if song is not None and song == cached_song:
+                return cached_duration
+            
+            # 缓存未命中时从播放器获取
+            audio_player = service.audio_player
+            if audio_player:
+                duration = audio_player.get_duration()
                 if duration > 0:
+                    self._duration_cache = (song, duration)
                     return duration
             
-            # 尝试从缓存获取
-            if hasattr(self, '_cached_duration') and self._cached_duration > 0:
-                return self._cached_duration
+            # 播放器暂未给出时长时沿用上次的有效时长
+            if cached_duration > 0:
+                return cached_duration
             
             # 默认返回0
             return 0
         except Exception as e:
-            logger.error(f"获取歌曲时长失败: {e}")
+            logger.error("获取歌曲时长失败: %s", e)
             return 0
     
     def reset_progress_to_current(self):
@@ -622,85 +595,91 @@ class PlaybackControlComponent:
             duration = self.get_current_duration()
             
             if duration > 0:
-                current_progress = (position / duration) * 100
-                self._updating_progress = True
-                self.progress_slider.value = current_progress
-                self._updating_progress = False
+                self._set_progress_value(int(position * 100 / duration), force=True)
             else:
-                self._updating_progress = True
-                self.progress_slider.value = 0
-                self._updating_progress = False
+                self._set_progress_value(0, force=True)
                 
         except Exception as e:
-            logger.error(f"重置进度条失败: {e}")
+            logger.error("重置进度条失败: %s", e)
     
     def get_current_position(self):
-        """获取当前播放位置"""
-        try:
-            if self.playback_controller.playback_service.audio_player:
-                position = self.playback_controller.playback_service.audio_player.get_position()
-                return max(0, position)  # 确保位置不为负数
+        """获取当前播放位置（有尚未完成的跳转时返回跳转目标位置）"""
+        if self._pending_seek_time is not None:
+            return self._pending_seek_time
+        audio_player = self.playback_controller.playback_service.audio_player
+        if not audio_player:
+            return 0
+        
+        # 不支持位置查询的播放器（如系统命令播放）直接返回0，不再调用
+        if not getattr(audio_player, 'supports_position', True):
             return 0
+        try:
+            return max(0, audio_player.get_position())  # 确保位置不为负数
         except Exception as e:
-            logger.error(f"获取播放位置失败: {e}")
+            logger.error("获取播放位置失败: %s", e)
             return 0
     
     def update_progress(self, position: float = None, duration: float = None):
         """更新播放进度"""
         try:
+            # 用户拖拽中，保持滑块和时间显示为拖拽位置，避免来回跳动
+            if self._scrubbing:
+                return
+            
             # 获取实时位置和时长
             if position is None:
                 position = self.get_current_position()
             if duration is None:
                 duration = self.get_current_duration()
             
-            # 缓存时长
+            # 更新进度条 - 按整数百分比更新，百分比不变时不写入
             if duration > 0:
-                self._cached_duration = duration
-            
-            # 更新进度条
-            if duration > 0:
-                progress_percent = (position / duration) * 100
-                
-                # 只有在进度变化较大时才更新进度条
-                current_progress = getattr(self.progress_slider, 'value', 0)
-                if abs(progress_percent - current_progress) > 0.1:  # 只有变化超过0.1%才更新
-                    self._updating_progress = True
-                    self.progress_slider.value = progress_percent
-                    self._updating_progress = False
+                self._set_progress_value(int(position * 100 / duration))
             
             # 更新时间显示
             self.update_time_display(position, duration)
             
         except Exception as e:
-            logger.error(f"更新播放进度失败: {e}")
+            logger.error("更新播放进度失败: %s", e)
+    
+    def _set_progress_value(self, percent: int, force: bool = False):
+        """程序写入进度条值，屏蔽由此触发的 on_change"""
+        if percent == self._last_progress_int and not force:
+            return
+        self._updating_progress = True
+        try:
+            self.progress_slider.value = percent
+        finally:
+            self._updating_progress = False
+        self._last_progress_int = percent
     
     def update_time_display(self, position: float, duration: float):
         """更新时间显示"""
         try:
-            # 格式化时间
-            current_min = int(position // 60)
-            current_sec = int(position % 60)
-            total_min = int(duration // 60)
-            total_sec = int(duration % 60)
+            # 只有整数秒变化时才格式化并更新显示
+            cur_s = int(position)
+            if cur_s != self._last_cur_sec:
+                self.current_time_label.text = _mmss(cur_s)
+                self._last_cur_sec = cur_s
             
-            # 更新显示
-            self.current_time_label.text = f"{current_min:02d}:{current_sec:02d}"
-            self.total_time_label.text = f"{total_min:02d}:{total_sec:02d}"
+            dur_s = int(duration)
+            if dur_s != self._last_dur_sec:
+                self.total_time_label.text = _mmss(dur_s)
+                self._last_dur_sec = dur_s
             
         except Exception as e:
-            logger.error(f"更新时间显示失败: {e}")
+            logger.error("更新时间显示失败: %s", e)
     
     def reset_progress(self):
         """重置进度显示"""
         try:
-            self._updating_progress = True
-            self.progress_slider.value = 0
-            self._updating_progress = False
+            self._set_progress_value(0, force=True)
             self.current_time_label.text = "00:00"
             self.total_time_label.text = "00:00"
+            self._last_cur_sec = 0
+            self._last_dur_sec = 0
         except Exception as e:
-            logger.error(f"重置进度显示失败: {e}")
+            logger.error("重置进度显示失败: %s", e)
     
     def get_volume(self) -> int:
         """获取当前音量值"""
@@ -717,7 +696,7 @@ class PlaybackControlComponent:
             self.play_pause_button.enabled = enabled
             self.stop_button.enabled = enabled
         except Exception as e:
-            logger.error(f"设置控制按钮状态失败: {e}")
+            logger.error("设置控制按钮状态失败: %s", e)
     
     @property
     def widget(self):
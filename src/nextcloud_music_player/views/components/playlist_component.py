@@ -11,6 +11,9 @@ from typing import Optional, Dict, List, Any, Callable
 
 logger = logging.getLogger(__name__)
 
+# 非当前歌曲行的 (图标, 状态文字)
+_IDLE_ROW_MARKER = ("🎶", "")
+
 class PlaylistViewComponent:
     """播放列表视图组件 - 负责播放列表的界面显示和用户交互"""
     
@@ -37,6 +40,15 @@ class PlaylistViewComponent:
         self.playlist_table = None
         self.playlist_controls_box = None
         
+        # 上次渲染时的播放列表签名，用于跳过无变化的重建
+        self._display_signature = None
+        # 已显示的表格行内容 (图标, 标题, 副标题)，用于差异更新
+        self._playlist_row_cache = []
+        # 歌曲信息字典的显示标题缓存: id(info) -> (info, 标题)
+        self._title_cache = {}
+        # 表格行对象 id -> 行索引，用于 O(1) 获取选中项索引
+        self._row_index_by_id = {}
+        
         # 创建UI
         self.create_ui()
         
@@ -67,8 +79,7 @@ class PlaylistViewComponent:
         )
         
         # 组装UI
-        self.playlist_box.add(self.playlist_header_box)
-        self.playlist_box.add(self.playlist_table)
+        self.playlist_box.add(self.playlist_header_box, self.playlist_table)
     
     def create_playlist_header(self):
         """创建播放列表头部 - 信息标签和控制按钮在同一行"""
@@ -143,14 +154,10 @@ class PlaylistViewComponent:
         )
         
         # 添加按钮到控制按钮容器
-        self.playlist_controls_box.add(clear_button)
-        self.playlist_controls_box.add(remove_button)
-        self.playlist_controls_box.add(refresh_button)
-        self.playlist_controls_box.add(manage_button)
+        self.playlist_controls_box.add(clear_button, remove_button, refresh_button, manage_button)
         
         # 组装头部 - 信息标签在左，控制按钮在右
-        self.playlist_header_box.add(self.playlist_info_label)
-        self.playlist_header_box.add(self.playlist_controls_box)
+        self.playlist_header_box.add(self.playlist_info_label, self.playlist_controls_box)
     
         
     def refresh_display(self):
@@ -165,6 +172,8 @@ class PlaylistViewComponent:
             # 更新播放列表内容
             self.update_playlist_content(current_playlist)
             
+            self._display_signature = self._get_display_signature(current_playlist)
+            
         except Exception as e:
             logger.error(f"刷新播放列表显示失败: {e}")
             self.show_error_message("刷新播放列表失败")
@@ -188,107 +197,111 @@ class PlaylistViewComponent:
     def update_playlist_content(self, playlist_data: Dict[str, Any]):
         """更新播放列表内容表格"""
         try:
-            # 清空现有数据
-            self.playlist_table.data.clear()
-            
             songs = playlist_data.get('songs', [])
             current_index = playlist_data.get('current_index', 0)
             
-            if not songs:
-                # 显示空列表提示
-                self.playlist_table.data.append({
-                    'icon': "📝",
-                    'title': "播放列表为空",
-                    'subtitle': "请从文件列表添加音乐或导入播放列表"
-                })
-                return
-            
-            # 添加歌曲到表格
-            for i, song_entry in enumerate(songs):
-                self.add_song_to_table(song_entry, i, current_index)
+            self._sync_rows(songs, current_index)
                 
         except Exception as e:
             logger.error(f"更新播放列表内容失败: {e}")
     
-    def add_song_to_table(self, song_entry: Dict[str, Any], index: int, current_index: int):
-        """添加单首歌曲到表格"""
+    def _sync_rows(self, songs: List[Dict[str, Any]], current_index: int):
+        """计算所有行内容，只更新与已显示内容不同的行"""
+        if songs:
+            # 播放状态对所有行相同，只计算一次当前行标记
+            is_playing, is_paused = self._get_play_state()
+            if is_playing:
+                current_marker = ("播放中 🔊", "播放中")
+            elif is_paused:
+                current_marker = ("暂停 ⏸", "暂停")
+            else:
+                current_marker = ("待播放 ●", "待播放")
+            
+            build_row = self._build_song_row
+            new_rows = [
+                build_row(song_entry, current_marker if i == current_index else _IDLE_ROW_MARKER)
+                for i, song_entry in enumerate(songs)
+            ]
+        else:
+            # 显示空列表提示
+            new_rows = [("📝", "播放列表为空", "请从文件列表添加音乐或导入播放列表")]
+        
+        # 歌曲被移除后清理不再使用的标题缓存
+        if len(self._title_cache) > 2 * len(songs) + 16:
+            self._title_cache = {}
+        
+        data = self.playlist_table.data
+        old_rows = self._playlist_row_cache
+        if len(old_rows) == len(new_rows) == len(data):
+            for i, (old, new) in enumerate(zip(old_rows, new_rows)):
+                if old != new:
+                    self._set_row(data[i], new)
+        else:
+            # 行数变化时才整体重建，一次性替换数据源而不是逐行插入
+            self.playlist_table.data = [
+                {'icon': icon, 'title': title, 'subtitle': subtitle}
+                for icon, title, subtitle in new_rows
+            ]
+            data = self.playlist_table.data
+            # 行对象已替换，重建行索引映射
+            self._row_index_by_id = {id(row): i for i, row in enumerate(data)}
+        
+        self._playlist_row_cache = new_rows
+    
+    def _set_row(self, data_item, row: tuple):
+        """把行内容写入表格中的已有行"""
+        icon, title, subtitle = row
+        if isinstance(data_item, dict):
+            data_item.update(icon=icon, title=title, subtitle=subtitle)
+        else:
+            # Row对象，只设置变化的属性
+            if data_item.icon != icon:
+                data_item.icon = icon
+            if data_item.title != title:
+                data_item.title = title
+            if data_item.subtitle != subtitle:
+                data_item.subtitle = subtitle
+    
+    def _build_song_row(self, song_entry: Dict[str, Any], marker: tuple) -> tuple:
+        """构建单首歌曲的 (图标, 标题, 副标题) 行内容，marker 为 (图标, 状态文字)"""
         try:
+            icon, status = marker
             song_info = song_entry.get("info", {})
-            song_state = song_entry.get("state", {})
-            
-            # 获取歌曲显示名称
-            title = song_info.get('title', song_info.get('display_name', song_entry.get('name', '未知歌曲')))
-            if title.endswith('.mp3'):
-                title = title[:-4]
-            
-            # 获取艺术家信息
-            artist = song_info.get('artist', '未知艺术家')
-            
-            # 确定图标和状态
-            if index == current_index:
-                # 检查播放状态 - 使用 playback_service 获取真实状态
-                if self.playback_service:
-                    is_playing = self.playback_service.is_playing()
-                    is_paused = getattr(self.playback_service, 'current_song_state', {}).get('is_paused', False)
-                    
-                    if is_playing:
-                        icon = "播放中 🔊"
-                        status = "播放中"
-                    elif is_paused:
-                        icon = "暂停 ⏸"
-                        status = "暂停"
-                    else:
-                        icon = "待播放 ●"
-                        status = "待播放"
-                else:
-                    # 如果没有 playback_service，回退到 app 属性检查
-                    if getattr(self.app, 'is_playing', False):
-                        icon = "播放中 🔊"
-                        status = "播放中"
-                    elif getattr(self.app, 'is_paused', False):
-                        icon = "暂停 ⏸"
-                        status = "暂停"
-                    else:
-                        icon = "待播放 ●"
-                        status = "待播放"
-            else:
-                icon = "🎶"
-                status = ""
-            
-            # 检查下载状态
-            is_downloaded = song_info.get('is_downloaded', False)
-            download_icon = "📁" if is_downloaded else "☁️"
+            info_get = song_info.get
+            state_get = song_entry.get("state", {}).get
             
-            # 播放统计
-            play_count = song_state.get('play_count', 0)
-            is_favorite = song_state.get('is_favorite', False)
+            # 获取歌曲显示名称（同一信息字典只计算一次）
+            cached = self._title_cache.get(id(song_info))
+            if cached is not None and cached[0] is song_info:
+                title = cached[1]
+            else:
+                title = info_get('title', info_get('display_name', song_entry.get('name', '未知歌曲')))
+                if title.endswith('.mp3'):
+                    title = title[:-4]
+                self._title_cache[id(song_info)] = (song_info, title)
             
-            # 构建副标题
-            subtitle_parts = [download_icon]
+            # 构建副标题：下载状态 | 播放状态 | 艺术家 | 播放次数 | 收藏
+            subtitle_parts = ["📁" if info_get('is_downloaded', False) else "☁️"]
             
             if status:
                 subtitle_parts.append(status)
             
+            artist = info_get('artist', '未知艺术家')
             if artist and artist != '未知艺术家':
                 subtitle_parts.append(f"🎤 {artist}")
             
+            play_count = state_get('play_count', 0)
             if play_count > 0:
                 subtitle_parts.append(f"🔄 {play_count}次")
             
-            if is_favorite:
+            if state_get('is_favorite', False):
                 subtitle_parts.append("❤️")
             
-            subtitle = " | ".join(subtitle_parts)
-            
-            # 添加到表格
-            self.playlist_table.data.append({
-                'icon': icon,
-                'title': title,
-                'subtitle': subtitle
-            })
+            return (icon, title, " | ".join(subtitle_parts))
             
         except Exception as e:
-            logger.error(f"添加歌曲到表格失败: {e}")
+            logger.error(f"构建播放列表行失败: {e}")
+            return ("🎶", song_entry.get('name', '未知歌曲'), "")
     
     def on_song_selected(self, widget):
         """处理歌曲选择事件"""
@@ -335,8 +348,15 @@ class PlaylistViewComponent:
             
             # 获取选中项在数据中的索引
             selected_item = self.playlist_table.selection
-            for i, item in enumerate(self.playlist_table.data):
-                if item == selected_item:
+            data = self.playlist_table.data
+            index = self._row_index_by_id.get(id(selected_item))
+            if index is not None and index < len(data) and data[index] is selected_item:
+                return index
+            
+            # 映射未命中时逐行比较行对象本身，并重建映射
+            self._row_index_by_id = {id(row): i for i, row in enumerate(data)}
+            for i, item in enumerate(data):
+                if item is selected_item:
                     return i
             
             return -1
@@ -489,78 +509,8 @@ class PlaylistViewComponent:
             if not songs or current_index >= len(songs):
                 return
             
-            # 更新表格中每个项目的图标，只更新必要的部分
-            for i, data_item in enumerate(self.playlist_table.data):
-                if i >= len(songs):
-                    continue
-                    
-                song_entry = songs[i]
-                song_info = song_entry.get("info", {})
-                
-                # 确定新的图标
-                if i == current_index:
-                    # 检查播放状态 - 使用 playback_service 获取真实状态
-                    if self.playback_service:
-                        is_playing = self.playback_service.is_playing()
-                        is_paused = getattr(self.playback_service, 'current_song_state', {}).get('is_paused', False)
-                        
-                        if is_playing:
-                            new_icon = "播放中 🔊"
-                            status = "播放中"
-                        elif is_paused:
-                            new_icon = "暂停 ⏸"
-                            status = "暂停"
-                        else:
-                            new_icon = "待播放 ●"
-                            status = "待播放"
-                    else:
-                        # 如果没有 playback_service，回退到 app 属性检查
-                        if getattr(self.app, 'is_playing', False):
-                            new_icon = "播放中 🔊"
-                            status = "播放中"
-                        elif getattr(self.app, 'is_paused', False):
-                            new_icon = "暂停 ⏸"
-                            status = "暂停"
-                        else:
-                            new_icon = "待播放 ●"
-                            status = "待播放"
-                else:
-                    new_icon = "🎶"
-                    status = ""
-                
-                # 更新图标 - 检查data_item是否为字典
-                if hasattr(data_item, 'icon'):
-                    # 如果是Row对象，直接设置属性
-                    if data_item.icon != new_icon:
-                        data_item.icon = new_icon
-                        
-                        # 更新副标题中的状态信息
-                        subtitle_parts = data_item.subtitle.split(" | ")
-                        
-                        # 移除旧的状态信息
-                        subtitle_parts = [part for part in subtitle_parts if part not in ["播放中", "暂停", "待播放"]]
-                        
-                        # 添加新的状态信息
-                        if status:
-                            subtitle_parts.insert(1, status)  # 在下载状态后插入
-                        
-                        data_item.subtitle = " | ".join(subtitle_parts)
-                elif isinstance(data_item, dict):
-                    # 如果是字典，按字典方式访问
-                    if data_item.get('icon') != new_icon:
-                        data_item['icon'] = new_icon
-                        
-                        # 更新副标题中的状态信息
-                        subtitle_parts = data_item['subtitle'].split(" | ")
-                        
-                        # 移除旧的状态信息
-                        subtitle_parts = [part for part in subtitle_parts if part not in ["播放中", "暂停", "待播放"]]
-                        
-                        # 添加新的状态信息
-                        if status:
-                            subtitle_parts.insert(1, status)  # 在下载状态后插入
-                        
-                        data_item['subtitle'] = " | ".join(subtitle_parts)
+            # 按新的当前索引计算行内容，只更新变化的行
+            self._sync_rows(songs, current_index)
             
             logger.debug(f"更新播放指示器完成，当前索引: {current_index}")
             
@@ -644,8 +594,32 @@ class PlaylistViewComponent:
             logger.error(f"获取上一首歌曲信息失败: {e}")
             return None
     
+    def _get_play_state(self):
+        """获取 (是否播放中, 是否暂停) 状态"""
+        if self.playback_service:
+            is_playing = self.playback_service.is_playing()
+            is_paused = getattr(self.playback_service, 'current_song_state', {}).get('is_paused', False)
+        else:
+            is_playing = getattr(self.app, 'is_playing', False)
+            is_paused = getattr(self.app, 'is_paused', False)
+        return is_playing, is_paused
+    
+    def _get_display_signature(self, playlist_data: Dict[str, Any]) -> tuple:
+        """计算影响表格显示的状态签名（修改计数覆盖歌曲信息的原地修改）"""
+        songs = playlist_data.get('songs', [])
+        is_playing, is_paused = self._get_play_state()
+        return (playlist_data.get('current_index', 0), is_playing, is_paused, len(songs), id(songs),
+                self.playlist_manager.change_version)
+    
     def update_display(self):
-        """更新显示（与refresh_display相同，为了兼容性）"""
+        """更新显示（仅在播放列表或播放状态变化时才重建表格）"""
+        try:
+            current_playlist = self.playlist_manager.create_default_playlist_if_needed()
+            if self._get_display_signature(current_playlist) == self._display_signature:
+                return
+        except Exception as e:
+            logger.error(f"检查播放列表状态失败: {e}")
+        
         self.refresh_display()
     
     @property
@@ -397,7 +397,7 @@ class ConnectionView:
         finally:
             self.connect_button.enabled = True
     
-    async def disconnect_from_nextcloud(self, widget):
+    def disconnect_from_nextcloud(self, widget):
         """断开NextCloud连接"""
         try:
             self.app.nextcloud_client = None
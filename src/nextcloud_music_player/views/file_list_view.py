@@ -289,31 +289,27 @@ class FileListView:
             music_files = self.music_service.get_all_songs()
 
         self.music_files = music_files
-        # 更新音乐文件到列表
-        self.music_list.data.clear()
+        # 先构建全部行数据，再一次性赋值给列表，避免逐行追加引发多次重绘
+        rows = []
         for file_info in self.music_files:
             # 检查文件是否已下载
-            is_downloaded = file_info.get('is_downloaded', False)
-            download_status = "✅" if is_downloaded else "⬇️"
-            
-            # 检查文件是否被选中
-            file_title = file_info.get('display_name', file_info['name'])
-            is_selected = file_info['title'] in self.selected_files
-            selection_status = "☑️" if is_selected else "☐"
-            
-            # 格式化显示信息，包含选择状态
-            title = f"{selection_status} {file_title}"
-            subtitle = f"{download_status} 大小: {self.format_file_size(file_info.get('size', 0))}"
-            
-            # 不使用图标以避免加载错误
-            self.music_list.data.append({
-                'title': title,
-                'subtitle': subtitle,
+            download_status = "✅" if file_info.get('is_downloaded', False) else "⬇️"
+            
+            # 格式化显示信息，包含选择状态；不使用图标以避免加载错误
+            rows.append({
+                'title': self._format_file_title(file_info),
+                'subtitle': f"{download_status} 大小: {self.format_file_size(file_info.get('size', 0))}",
                 'file_info': file_info
             })
+        self.music_list.data = rows
 
         self.update_stats()
 
+    def _format_file_title(self, file_info: Dict) -> str:
+        """生成列表行标题：选择状态 + 显示名称"""
+        selection_status = "☑️" if file_info['title'] in self.selected_files else "☐"
+        return f"{selection_status} {file_info.get('display_name', file_info['name'])}"
+
     async def sync_music_list(self, widget):
         """同步音乐列表"""
         if self.is_syncing:
@@ -377,8 +373,9 @@ class FileListView:
             else:
                 self.selected_files.add(file_path)
             
-            # 刷新列表显示以更新选择状态
-            self.reload_music_list()
+            # 只更新被点击行的选择状态，不重新加载整个列表
+            selected_item.title = self._format_file_title(file_info)
+            self.update_stats()
             self.update_button_states()
     
     def add_to_playlist(self, widget):
@@ -467,13 +464,13 @@ class FileListView:
             current_info = self.music_service.get_song_info(song_name)
             
             # 创建编辑对话框
-            await self.show_edit_dialog(song_name, current_info)
+            self.show_edit_dialog(song_name, current_info)
             
         except Exception as e:
             logger.error(f"编辑文件信息失败: {e}")
             self.show_message(f"编辑失败: {str(e)}", "error")
     
-    async def show_edit_dialog(self, song_name: str, current_info: dict):
+    def show_edit_dialog(self, song_name: str, current_info: dict):
         """显示编辑对话框"""
         try:
             # 创建编辑界面
@@ -699,7 +696,7 @@ class FileListView:
         self.download_status_box.add(progress_label)
     
     
-    async def clear_cache(self, widget):
+    def clear_cache(self, widget):
         """清除缓存 (删操作)"""
         try:
             # 清除音乐服务缓存 (删操作)
@@ -711,6 +708,11 @@ class FileListView:
             self.music_list.data.clear()
             self.update_stats()
             
+            # 本地文件已删除，播放界面预取的路径不再可用
+            playback_view = self.view_manager.get_view("playback")
+            if playback_view:
+                playback_view.clear_local_path_cache()
+            
             self.show_message("缓存已清除，music_list.json 已删除", "success")
             logger.info("清除缓存并删除 music_list.json")
             
@@ -195,17 +195,16 @@ class FolderSelector:
             # 获取文件夹列表
             folders = await self.get_folders(self.current_path)
             
-            # 清空现有列表
-            self.folder_list.data.clear()
-            
-            # 添加文件夹到列表
-            for folder in folders:
-                self.folder_list.data.append({
+            # 一次性替换列表数据，避免逐行插入触发多次界面刷新
+            self.folder_list.data = [
+                {
                     'icon': None,  # 修复：移除不存在的 Icon.DEFAULT
                     'title': f"📁 {folder['name']}",
                     'subtitle': folder.get('modified', ''),
                     'data': folder
-                })
+                }
+                for folder in folders
+            ]
             
             # 更新路径显示
             self.path_display.text = self.current_path or "/"
@@ -9,26 +9,98 @@ from toga.style.pack import COLUMN, ROW
 import asyncio
 import logging
 from typing import Optional, Dict, List, Any
-from enum import Enum
+from enum import Enum, IntEnum
 import os
 import json
+import time
+import weakref
 from datetime import datetime
 from ..services.playback_service import PlaybackService
 from ..services.playlist_manager import PlaylistManager
-from ..services.playback_controller import PlaybackController, PlayMode
+from ..services.playback_controller import PlaybackController, PlayMode, PLAY_MODE_BY_NAME
+from ..platform_audio import is_ios
 from .components.playlist_component import PlaylistViewComponent
 from .components.playback_control_component import PlaybackControlComponent
 from ..utils.platform_ui import get_safe_area_bottom_padding
 
 logger = logging.getLogger(__name__)
 
+
+# 空闲时UI定时循环的轮询间隔（秒），开始播放时会被立即唤醒
+_IDLE_UI_POLL_INTERVAL = 5.0
+
+# 消息类型对应的背景色和图标
+_MSG_STYLES = {
+    "error": ("#ffcccc", "❌ "),
+    "success": ("#ccffcc", "✅ "),
+    "warning": ("#ffffcc", "⚠️ "),
+    "info": ("#cce5ff", "ℹ️ "),
+}
+
+
+class _PlaybackPhase(IntEnum):
+    """歌曲播放阶段 - 自动播放下一曲的状态机"""
+    PLAYING = 0     # 正常播放中
+    COMPLETING = 1  # 已检测到播放完成，等待切换到下一曲
+
+
+class _SongState:
+    """当前歌曲播放状态（固定字段）"""
+    __slots__ = ('is_playing', 'is_paused', 'position', 'duration', 'play_count', 'last_played')
+    
+    def __init__(self):
+        self.is_playing = False
+        self.is_paused = False
+        self.position = 0
+        self.duration = 0
+        self.play_count = 0
+        self.last_played = None
+
+
 class PlaybackView:
     """音乐播放界面视图 - 基于 playlists.json 的播放列表管理"""
     
     def __init__(self, app, view_manager):
-        self.app = app  # 保留app引用以传递给service
-        self.view_manager = view_manager
+        # 使用弱引用代理持有父级对象，避免 app/view_manager 与视图之间形成引用循环
+        self.app = weakref.proxy(app)
+        self.view_manager = weakref.proxy(view_manager)
         self.play_mode = PlayMode.REPEAT_ONE
+        # 运行平台在运行期间不会改变，只判断一次
+        self._is_ios = is_ios()
+        # 播放时的UI轮询间隔：iOS用2秒降低开销避免卡顿，其他平台0.5秒
+        self._ui_interval = 2.0 if self._is_ios else 0.5
+        # 判定歌曲播放完成的进度阈值：iOS提高阈值，避免频繁触发
+        self._completion_threshold = 0.98 if self._is_ios else 0.99
+        # 按时长预先算好的 (时长, 完成位置, 重置位置)，时长变化时重新计算
+        self._completion_marks = (0, 0.0, 0.0)
+        # 预取时确认存在的本地文件 {歌曲名: 文件路径}，命中时播放前不再stat
+        self._local_path_cache: Dict[str, str] = {}
+        
+        # 已写入控件的属性值缓存，值未变化时跳过写入
+        self._ui_cache = {}
+        
+        # UI 重绘节流：把重绘频率与状态轮询频率解耦
+        self._last_ui_update = 0.0
+        self._ui_min_interval = 1 / 20
+        self._last_is_playing = None
+        # 被节流跳过的刷新由一次延迟刷新补上
+        self._trailing_ui_handle = None
+        # 播放状态变化时唤醒UI定时循环（事件在协程内创建）
+        self._ui_wake_event = None
+        
+        # 单次UI刷新内的当前歌曲条目缓存: (刷新序号, 条目)
+        self._ui_tick_id = 0
+        self._in_ui_tick = False
+        self._current_song_cache = (None, None)
+        # 合并后的当前歌曲信息缓存: (歌曲名, 播放列表信息字典, 合并结果)
+        self._song_info_cache = (None, None, None)
+        # 歌曲信息缓存失效的次数，计入界面刷新签名
+        self._song_info_version = 0
+        
+        # 有尚未反映到界面的状态变化（由 update_ui 清除）
+        self._needs_ui_refresh = False
+        # 上次刷新时的播放状态签名
+        self._last_ui_sig = None
 
         # 初始化播放服务
         self.playback_service = PlaybackService(
@@ -38,12 +110,33 @@ class PlaybackView:
             add_background_task_callback=app.add_background_task
         )
         
+        # 订阅播放服务的播放/暂停状态变化，避免在刷新时反复查询
+        self._is_playing = False
+        self._is_paused = False
+        # 暂停/停止后是否已刷新过一次进度，之后的定时刷新可直接跳过
+        self._progress_idle = False
+        # 上次渲染到状态标签和播放按钮的 (is_playing, is_paused)
+        self._last_play_state = None
+        self._state_refresh_handle = None
+        # 消息自动隐藏的定时器句柄
+        self._hide_message_handle = None
+        # 当前正在启动播放的任务，快速切歌时取消上一个
+        self._current_play_task: Optional[asyncio.Task] = None
+        # 自动播放下一曲的任务，防止重复触发
+        self._auto_next_task: Optional[asyncio.Task] = None
+        self.playback_service.add_state_listener(self._on_service_state_changed)
+        
         # 初始化播放列表管理器
         self.playlist_manager = PlaylistManager(
             config_manager=app.config_manager,
             music_service=getattr(app, 'music_service', None)
         )
         
+        # 界面组件在控制器之后创建，先占位以便回调中直接判断
+        self.playback_control_component = None
+        self.playlist_component = None
+        self.status_label = None
+        
         # 初始化播放控制器
         self.playback_controller = PlaybackController(
             playback_service=self.playback_service,
@@ -54,44 +147,33 @@ class PlaybackView:
         
         # 初始化播放控制组件
         self.playback_control_component = PlaybackControlComponent(
-            app=app,
+            app=self.app,
             playback_controller=self.playback_controller,
             on_play_mode_change_callback=self.on_play_mode_changed
         )
         
         # 初始化播放列表视图组件
         self.playlist_component = PlaylistViewComponent(
-            app=app,
+            app=self.app,
             playlist_manager=self.playlist_manager,
             on_song_select_callback=self.on_playlist_song_selected,
             on_playlist_change_callback=self.on_playlist_changed,
             playback_service=self.playback_service
         )
         
-        # 初始化歌词显示组件
-        try:
-            from .components.lyrics_component import LyricsDisplayComponent
-            
-            # 获取歌词服务（如果应用有的话）
-            lyrics_service = getattr(app, 'lyrics_service', None)
-            
-            self.lyrics_component = LyricsDisplayComponent(
-                app=app,
-                config_manager=app.config_manager,
-                lyrics_service=lyrics_service
-            )
-            logger.info("歌词组件初始化成功")
-        except ImportError as e:
-            logger.warning(f"歌词组件导入失败，将不显示歌词: {e}")
-            self.lyrics_component = None
+        # 歌词显示组件在首次切换到歌词视图时才创建
+        self.lyrics_component = None
+        self.lyrics_box = None
+        self._lyrics_built = False
         
         # 设置播放控制回调
+        app_proxy = self.app
         self.playback_service.set_playback_callbacks(
             pause_callback=None,  # 由服务自己处理
             stop_callback=None,   # 由服务自己处理
             get_play_mode_callback=None,
             get_is_playing_callback=None,  # 由服务自己处理
-            set_volume_callback=lambda volume: setattr(app, 'volume', volume),
+            set_volume_callback=lambda volume: setattr(app_proxy, 'volume', volume),
             seek_to_position_callback=None,
             get_duration_callback=None,
             set_play_mode_callback=None
@@ -105,16 +187,9 @@ class PlaybackView:
         # 播放列表管理 - 由播放列表管理器和组件处理
         self.current_playlist_data = None  # 当前播放列表数据（保留以供兼容）
         self.current_song_info = None      # 当前歌曲信息（从 music_list.json 获取）
-        self.current_song_state = {        # 当前歌曲播放状态
-            'is_playing': False,
-            'is_paused': False,
-            'position': 0,
-            'duration': 0,
-            'play_count': 0,
-            'last_played': None
-        }
-        # 播放完成标记
-        self._song_completed = False
+        self.current_song_state = _SongState()  # 当前歌曲播放状态
+        # 播放阶段（检测播放完成，防止重复触发自动播放下一曲）
+        self._playback_phase = _PlaybackPhase.PLAYING
         self._last_position = 0
         # 切换歌曲状态标志（防止重复点击）
         self._switching_song = False
@@ -127,7 +202,7 @@ class PlaybackView:
         
         # 更新播放模式按钮状态（初始化为单曲循环）
         # 更新播放控制组件的播放模式按钮
-        if hasattr(self, 'playback_control_component') and self.playback_control_component:
+        if self.playback_control_component:
             self.playback_control_component.update_mode_buttons()
         
         # 播放列表组件会自动处理初始化和加载
@@ -152,6 +227,16 @@ class PlaybackView:
             padding=2,
             visibility="hidden"
         ))
+        # 复用同一个消息标签，显示消息时只修改文本
+        self._message_label = toga.Label(
+            "",
+            style=Pack(
+                padding=10,
+                flex=1,
+                color="#212529"
+            )
+        )
+        self.message_box.add(self._message_label)
         
         # 精简的标题 - 减少间距以节省空间
         title = toga.Label(
@@ -199,8 +284,7 @@ class PlaybackView:
         )
         
         # 靠左排列按钮
-        view_switch_box.add(self.playlist_tab_button)
-        view_switch_box.add(self.lyrics_tab_button)
+        view_switch_box.add(self.playlist_tab_button, self.lyrics_tab_button)
         
         # 内容区域容器 - 减少padding以减少空白区域
         self.content_container = toga.Box(style=Pack(
@@ -212,6 +296,54 @@ class PlaybackView:
         # 播放列表区域 - 使用播放列表组件
         self.playlist_box = self.playlist_component.get_widget()
         
+        # 默认显示播放列表；歌词视图在首次切换时创建并挂载
+        self.current_view = "playlist"
+        self.content_container.add(self.playlist_box)
+        
+        # 播放控制区域 - 移到最底部，使用播放控制组件的紧凑布局
+        # 创建播放控制包装容器，增加额外的底部安全空间
+        playback_controls_wrapper = toga.Box(style=Pack(
+            direction=COLUMN,
+            padding=(0, 0, safe_bottom_padding // 2, 0),  # 使用动态安全区域的一半作为额外间距
+            alignment="center"
+        ))
+        
+        self.playback_controls_widget = self.playback_control_component.widget
+        playback_controls_wrapper.add(self.playback_controls_widget)
+        
+        # 组装界面 - 新的顺序：标题->当前播放->视图切换->内容区域->播放控制（带动态安全区域）
+        # 一次性添加所有子组件，只触发一次布局计算
+        self.container.add(
+            self.message_box,
+            title,
+            self.now_playing_box,
+            view_switch_box,
+            self.content_container,
+            playback_controls_wrapper  # 使用包装后的播放控制，增加动态底部安全区域
+        )
+        
+    def _ensure_lyrics_built(self):
+        """首次需要时创建歌词组件和歌词视图，并加载当前歌曲的歌词"""
+        if self._lyrics_built:
+            return
+        self._lyrics_built = True
+        
+        try:
+            from .components.lyrics_component import LyricsDisplayComponent
+            
+            # 获取歌词服务（如果应用有的话）
+            lyrics_service = getattr(self.app, 'lyrics_service', None)
+            
+            self.lyrics_component = LyricsDisplayComponent(
+                app=self.app,
+                config_manager=self.app.config_manager,
+                lyrics_service=lyrics_service
+            )
+            logger.info("歌词组件初始化成功")
+        except ImportError as e:
+            logger.warning("歌词组件导入失败，将不显示歌词: %s", e)
+            self.lyrics_component = None
+        
         # 歌词显示区域
         if self.lyrics_component:
             self.lyrics_box = self.lyrics_component.get_widget()
@@ -232,35 +364,22 @@ class PlaybackView:
             )
             self.lyrics_box.add(lyrics_placeholder)
         
-        # 默认显示播放列表
-        self.current_view = "playlist"
-        self.content_container.add(self.playlist_box)
-        
-        # 播放控制区域 - 移到最底部，使用播放控制组件的紧凑布局
-        # 创建播放控制包装容器，增加额外的底部安全空间
-        playback_controls_wrapper = toga.Box(style=Pack(
-            direction=COLUMN,
-            padding=(0, 0, safe_bottom_padding // 2, 0),  # 使用动态安全区域的一半作为额外间距
-            alignment="center"
-        ))
-        
-        self.playback_controls_widget = self.playback_control_component.widget
-        playback_controls_wrapper.add(self.playback_controls_widget)
-        
-        # 组装界面 - 新的顺序：标题->当前播放->视图切换->内容区域->播放控制（带动态安全区域）
-        self.container.add(self.message_box)
-        self.container.add(title)
-        self.container.add(self.now_playing_box)
-        self.container.add(view_switch_box)
-        self.container.add(self.content_container)
-        self.container.add(playback_controls_wrapper)  # 使用包装后的播放控制，增加动态底部安全区域
+        # 两个视图都只挂载一次，之后切换时改变 display 而不是移除/重新添加子树
+        self.lyrics_box.style.display = "none"
+        self.content_container.add(self.lyrics_box)
         
+        # 补加载组件创建前已开始播放的歌曲的歌词
+        song_name = self.playback_service.get_current_song_name()
+        if self.lyrics_component and song_name:
+            self._schedule_lyrics_load(song_name)
+    
     def show_playlist_view(self, widget):
         """显示播放列表视图"""
         try:
             if self.current_view != "playlist":
-                self.content_container.clear()
-                self.content_container.add(self.playlist_box)
+                if self.lyrics_box is not None:
+                    self.lyrics_box.style.display = "none"
+                self.playlist_box.style.display = "pack"
                 self.current_view = "playlist"
                 
                 # 更新按钮样式
@@ -271,14 +390,15 @@ class PlaybackView:
                 
                 logger.debug("切换到播放列表视图")
         except Exception as e:
-            logger.error(f"显示播放列表视图失败: {e}")
+            logger.error("显示播放列表视图失败: %s", e)
     
     def show_lyrics_view(self, widget):
         """显示歌词视图"""
         try:
             if self.current_view != "lyrics":
-                self.content_container.clear()
-                self.content_container.add(self.lyrics_box)
+                self._ensure_lyrics_built()
+                self.playlist_box.style.display = "none"
+                self.lyrics_box.style.display = "pack"
                 self.current_view = "lyrics"
                 
                 # 更新按钮样式
@@ -289,7 +409,7 @@ class PlaybackView:
                 
                 logger.debug("切换到歌词视图")
         except Exception as e:
-            logger.error(f"显示歌词视图失败: {e}")
+            logger.error("显示歌词视图失败: %s", e)
     
     def update_services(self):
         """更新服务依赖 - 当app的服务实例更新时调用"""
@@ -302,7 +422,7 @@ class PlaybackView:
         try:
             song_info = song_entry.get('info', {})
             song_name = song_entry.get('name', '')
-            logger.info(f"播放列表选择歌曲: {song_info.get('name', song_name)} (索引: {index})")
+            logger.info("播放列表选择歌曲: %s (索引: %s)", song_info.get('name', song_name), index)
             
             # 更新当前歌曲信息
             self.current_song_info = song_info
@@ -310,7 +430,7 @@ class PlaybackView:
             
             # 加载歌词
             if self.lyrics_component and song_name:
-                self.lyrics_component.load_lyrics_for_song(song_name)
+                self._schedule_lyrics_load(song_name)
             
             # 如果设置了自动播放，则开始播放
             auto_play = self.app.config_manager.get("player.auto_play_on_select", True)
@@ -318,79 +438,80 @@ class PlaybackView:
                 self.app.add_background_task(self.play_selected_song(song_info))
                 
         except Exception as e:
-            logger.error(f"处理播放列表歌曲选择失败: {e}")
+            logger.error("处理播放列表歌曲选择失败: %s", e)
     
     def on_playlist_changed(self, change_type: str):
         """播放列表改变回调"""
         try:
-            logger.info(f"播放列表发生改变: {change_type}")
+            logger.info("播放列表发生改变: %s", change_type)
+            self._invalidate_song_info()
             
             # 根据改变类型执行相应操作
             if change_type in ["song_added", "song_removed", "cleared", "playlist_created", "songs_added_batch"]:
                 # 更新当前播放列表数据缓存
                 self.current_playlist_data = self.playlist_manager.get_current_playlist()
                 
-                # 如果播放列表被清空，停止播放
+                # 如果播放列表被清空，写回未保存的修改并停止播放
                 if change_type == "cleared":
+                    self.flush_current_playlist()
                     self.app.add_background_task(self.stop_music())
                     
         except Exception as e:
-            logger.error(f"处理播放列表改变失败: {e}")
+            logger.error("处理播放列表改变失败: %s", e)
+    
+    def _invalidate_song_info(self):
+        """丢弃合并后的歌曲信息缓存，下次刷新时重新合并并重绘"""
+        self._song_info_cache = (None, None, None)
+        self._song_info_version += 1
     
     def on_play_mode_changed(self, mode: str):
         """播放模式改变回调"""
         try:
-            logger.info(f"播放模式已改变为: {mode}")
+            logger.info("播放模式已改变为: %s", mode)
             # 同步更新视图的播放模式
-            if mode == "normal":
-                self.play_mode = PlayMode.NORMAL
-            elif mode == "repeat_one":
-                self.play_mode = PlayMode.REPEAT_ONE
-            elif mode == "repeat_all":
-                self.play_mode = PlayMode.REPEAT_ALL
-            elif mode == "shuffle":
-                self.play_mode = PlayMode.SHUFFLE
+            play_mode = PLAY_MODE_BY_NAME.get(mode)
+            if play_mode is not None:
+                self.play_mode = play_mode
                 
         except Exception as e:
-            logger.error(f"处理播放模式改变失败: {e}")
+            logger.error("处理播放模式改变失败: %s", e)
     
     def on_playback_state_changed(self, is_playing: bool):
         """播放状态改变回调 - 立即更新播放/暂停按钮"""
         try:
-            logger.info(f"播放状态改变为: {'播放中' if is_playing else '暂停'}")
-            # 立即更新播放控制组件的按钮状态
-            if hasattr(self, 'playback_control_component') and self.playback_control_component:
-                self.playback_control_component.update_play_pause_button(is_playing)
-                
-            # 更新状态标签
-            if hasattr(self, 'status_label') and self.status_label:
-                if is_playing:
-                    self.status_label.text = "播放中 🔊"
-                    self.status_label.style.color = "#28a745"  # 绿色表示播放
-                else:
-                    self.status_label.text = "暂停 ⏸"
-                    self.status_label.style.color = "#ffc107"  # 黄色表示暂停
-                    
-            # 强制刷新UI（如果需要）
-            if hasattr(self.app, 'main_window') and self.app.main_window:
-                # 在某些平台上可能需要强制刷新
-                pass
+            logger.info("播放状态改变为: %s", '播放中' if is_playing else '暂停')
+            # 立即更新播放/暂停按钮和状态标签（未在播放时显示为暂停）
+            if self.status_label:
+                self._render_play_state(is_playing, not is_playing)
+            
+            # 唤醒UI定时循环，立即刷新进度
+            self._wake_ui_loop()
                     
         except Exception as e:
-            logger.error(f"处理播放状态改变失败: {e}")
+            logger.error("处理播放状态改变失败: %s", e)
     
     async def play_selected_song(self, song_info: Dict[str, Any]):
         """播放选中的歌曲"""
         try:
+            song_name = song_info.get('name', '')
             # 如果歌曲已下载，直接播放本地文件
             if song_info.get('is_downloaded') and song_info.get('filepath'):
                 local_path = song_info['filepath']
-                if os.path.exists(local_path):
+                # 在线程池中检查文件，iOS沙盒上stat可能较慢
+                loop = asyncio.get_event_loop()
+                if self._local_path_cache.get(song_name) == local_path:
+                    await self.play_music_file(local_path)
+                    if self.playback_service.is_playing():
+                        return
+                    # 预取之后文件可能已被删除：丢弃缓存，文件确实不存在时改为下载
+                    self._local_path_cache.pop(song_name, None)
+                    if await loop.run_in_executor(None, os.path.exists, local_path):
+                        return
+                elif await loop.run_in_executor(None, os.path.exists, local_path):
                     await self.play_music_file(local_path)
                     return
             
             # 否则需要先下载
-            song_name = song_info.get('name', '')
             remote_path = song_info.get('remote_path', '')
             if self.app.music_service and remote_path:
                 # 使用music_service下载文件，然后播放
@@ -401,108 +522,131 @@ class PlaybackView:
                     if updated_song_info and updated_song_info.get('filepath'):
                         await self.play_music_file(updated_song_info['filepath'])
                     else:
-                        logger.error(f"下载成功但无法获取本地文件路径: {song_name}")
+                        logger.error("下载成功但无法获取本地文件路径: %s", song_name)
                 else:
-                    logger.error(f"下载歌曲失败: {song_name}")
+                    logger.error("下载歌曲失败: %s", song_name)
             else:
-                logger.error(f"无法下载歌曲，缺少必要信息: {song_name}")
+                logger.error("无法下载歌曲，缺少必要信息: %s", song_name)
             
         except Exception as e:
-            logger.error(f"播放选中歌曲失败: {e}")
+            logger.error("播放选中歌曲失败: %s", e)
+    
+    async def _prefetch_paths(self, song_infos: List[Dict[str, Any]]):
+        """在默认线程池中并行检查已下载歌曲的本地文件，缓存确认存在的路径"""
+        candidates = [
+            (info.get('name'), info['filepath'])
+            for info in song_infos
+            if info.get('is_downloaded') and info.get('filepath')
+        ]
+        if not candidates:
+            return
+
+        try:
+            loop = asyncio.get_event_loop()
+            results = await asyncio.gather(*(
+                loop.run_in_executor(None, os.path.exists, path) for _, path in candidates
+            ))
+            for (name, path), exists in zip(candidates, results):
+                if exists:
+                    self._local_path_cache[name] = path
+                else:
+                    self._local_path_cache.pop(name, None)
+        except Exception as e:
+            logger.error("预取本地文件路径失败: %s", e)
+    
+    def clear_local_path_cache(self):
+        """清空预取的本地文件路径（本地文件被删除或缓存被清除时调用）"""
+        self._local_path_cache.clear()
     
     async def play_music_file(self, file_path: str):
         """播放音乐文件"""
         try:
-            logger.info(f"开始播放音乐文件: {file_path}")
+            logger.info("开始播放音乐文件: %s", file_path)
             
-            # 设置当前歌曲
+            # 设置当前歌曲；单曲循环等重新播放同一首歌时，歌词和播放列表显示都不需要更新
+            previous_song = self.playback_service.get_current_song()
             self.playback_service.set_current_song(file_path)
+            same_song = previous_song == self.playback_service.get_current_song()
             
-            # 开始播放 - 使用超时保护
+            # 开始播放 - 使用超时保护；快速切歌时取消尚未完成的上一次播放
+            previous_task = self._current_play_task
+            if previous_task is not None and not previous_task.done():
+                previous_task.cancel()
+            play_task = asyncio.get_event_loop().create_task(self.playback_service.play_music())
+            self._current_play_task = play_task
             try:
-                await asyncio.wait_for(self.playback_service.play_music(), timeout=5.0)
+                await asyncio.wait_for(play_task, timeout=5.0)
             except asyncio.TimeoutError:
                 logger.error("播放音乐超时，可能存在死锁")
                 return
+            except asyncio.CancelledError:
+                if self._current_play_task is play_task:
+                    raise
+                logger.info("播放已被新的歌曲取代: %s", file_path)
+                return
+            finally:
+                if self._current_play_task is play_task:
+                    self._current_play_task = None
             
             # 更新播放状态
-            self.current_song_state['is_playing'] = True
-            self.current_song_state['is_paused'] = False
+            self.current_song_state.is_playing = True
+            self.current_song_state.is_paused = False
+            # 新歌曲开始播放，重新进入播放阶段
+            self._playback_phase = _PlaybackPhase.PLAYING
+            if not same_song:
+                # 下载等操作可能更新了音乐库信息，重新合并歌曲信息
+                self._invalidate_song_info()
+            self._wake_ui_loop()
             
             # 自动加载歌词 - 从文件路径提取歌曲名（异步执行，不阻塞）
-            if self.lyrics_component:
+            if self.lyrics_component and not same_song:
                 try:
-                    import os
                     song_name = os.path.basename(file_path)
-                    logger.info(f"播放音乐时自动加载歌词: {song_name}")
+                    logger.info("播放音乐时自动加载歌词: %s", song_name)
                     # 使用后台任务加载歌词，避免阻塞播放
-                    if hasattr(self.app, 'add_background_task'):
-                        self.app.add_background_task(
-                            self._load_lyrics_async(song_name)
-                        )
-                    else:
-                        self.lyrics_component.load_lyrics_for_song(song_name, auto_download=True)
+                    self._schedule_lyrics_load(song_name)
                 except Exception as lyrics_error:
-                    logger.warning(f"自动加载歌词失败: {lyrics_error}")
+                    logger.warning("自动加载歌词失败: %s", lyrics_error)
             
-            # 更新UI
-            self.update_ui()
-            logger.info(f"音乐文件播放成功: {file_path}")
+            # 更新UI（同一首歌重新播放时按状态签名判断是否需要刷新）
+            self.update_ui(force=not same_song)
+            logger.info("音乐文件播放成功: %s", file_path)
             
         except Exception as e:
-            logger.error(f"播放音乐文件失败: {e}")
-            import traceback
-            logger.error(f"详细错误: {traceback.format_exc()}")
+            logger.error("播放音乐文件失败: %s", e, exc_info=True)
+    
+    def _schedule_lyrics_load(self, song_name: str):
+        """在后台任务中加载歌词，文件读取和解析不阻塞事件循环"""
+        self.app.add_background_task(self._load_lyrics_async(song_name))
     
     async def _load_lyrics_async(self, song_name: str):
         """异步加载歌词"""
         try:
             if self.lyrics_component:
-                self.lyrics_component.load_lyrics_for_song(song_name, auto_download=True)
+                await self.lyrics_component.load_lyrics_for_song_async(song_name, auto_download=True)
         except Exception as e:
-            logger.warning(f"异步加载歌词失败: {e}")
+            logger.warning("异步加载歌词失败: %s", e)
             
     def show_message(self, message: str, message_type: str = "info"):
         """显示消息提示"""
-        # 清除之前的消息
-        self.message_box.clear()
-        
-        # 根据类型设置样式
-        if message_type == "error":
-            self.message_box.style.background_color = "#ffcccc"
-            icon = "❌ "
-        elif message_type == "success":
-            self.message_box.style.background_color = "#ccffcc"
-            icon = "✅ "
-        elif message_type == "warning":
-            self.message_box.style.background_color = "#ffffcc"
-            icon = "⚠️ "
-        else:  # info
-            self.message_box.style.background_color = "#cce5ff"
-            icon = "ℹ️ "
-            
-        # 创建消息标签
-        message_label = toga.Label(
-            f"{icon}{message}",
-            style=Pack(
-                padding=10,
-                flex=1,
-                color="#212529"
-            )
-        )
-        
-        self.message_box.add(message_label)
-        self.message_box.style.visibility = "visible"
-        
-        # 设置定时器隐藏消息
-        async def hide_message():
-            await asyncio.sleep(5)
-            self.message_box.style.visibility = "hidden"
+        # 根据类型设置样式，未知类型按 info 显示
+        background_color, icon = _MSG_STYLES.get(message_type, _MSG_STYLES["info"])
+        self._set_style('message_bg', self.message_box, 'background_color', background_color)
+        self._message_label.text = f"{icon}{message}"
+        self._set_style('message_visibility', self.message_box, 'visibility', "visible")
         
-        self.app.add_background_task(hide_message())
-        logger.info(f"[{message_type.upper()}] {message}")
+        # 设置定时器隐藏消息；新消息会重新计时，避免旧定时器提前隐藏新消息
+        if self._hide_message_handle is not None:
+            self._hide_message_handle.cancel()
+        self._hide_message_handle = asyncio.get_event_loop().call_later(5, self._hide_message)
+        logger.info("[%s] %s", message_type.upper(), message)
 
     
+    def _hide_message(self):
+        """隐藏消息提示"""
+        self._hide_message_handle = None
+        self._set_style('message_visibility', self.message_box, 'visibility', "hidden")
+    
     def get_song_info_from_music_list(self, song_name: str) -> Dict[str, Any]:
         """从 music_list.json 获取歌曲信息"""
         song_info = self.playback_service.get_song_info(song_name)
@@ -522,6 +666,7 @@ class PlaybackView:
             if 0 <= index < len(songs):
                 current_playlist["current_index"] = index
                 self.playlist_manager.save_current_playlist(current_playlist)
+                self._current_song_cache = (None, None)
                 
                 # 同步更新缓存（保持兼容性）
                 self.current_playlist_data = current_playlist
@@ -529,15 +674,25 @@ class PlaybackView:
                 # 更新当前歌曲信息
                 self.update_current_song_info()
                 
-                logger.info(f"设置当前播放索引: {index}")
+                logger.info("设置当前播放索引: %s", index)
             else:
-                logger.warning(f"播放索引超出范围: {index}, 歌曲总数: {len(songs)}")
+                logger.warning("播放索引超出范围: %s, 歌曲总数: %s", index, len(songs))
                 
         except Exception as e:
-            logger.error(f"设置播放索引失败: {e}")
+            logger.error("设置播放索引失败: %s", e)
     
     def get_current_song_entry(self) -> Optional[Dict[str, Any]]:
-        """获取当前播放歌曲条目 - 直接从播放列表管理器获取最新数据"""
+        """获取当前播放歌曲条目 - 直接从播放列表管理器获取最新数据（单次UI刷新内缓存）"""
+        if self._in_ui_tick and self._current_song_cache[0] == self._ui_tick_id:
+            return self._current_song_cache[1]
+        
+        song_entry = self._lookup_current_song_entry()
+        if self._in_ui_tick:
+            self._current_song_cache = (self._ui_tick_id, song_entry)
+        return song_entry
+    
+    def _lookup_current_song_entry(self) -> Optional[Dict[str, Any]]:
+        """从播放列表管理器查找当前歌曲条目"""
         try:
             # 直接从播放列表管理器获取最新的播放列表数据
             current_playlist = self.playlist_manager.get_current_playlist()
@@ -548,18 +703,18 @@ class PlaybackView:
             current_index = current_playlist.get("current_index", 0)
             songs = current_playlist["songs"]
             
-            logger.debug(f"get_current_song_entry: 播放列表有 {len(songs)} 首歌，当前索引: {current_index}")
+            logger.debug("get_current_song_entry: 播放列表有 %s 首歌，当前索引: %s", len(songs), current_index)
             
             if 0 <= current_index < len(songs):
                 song_entry = songs[current_index]
-                logger.debug(f"get_current_song_entry: 返回歌曲: {song_entry.get('name', 'Unknown')}")
+                logger.debug("get_current_song_entry: 返回歌曲: %s", song_entry.get('name', 'Unknown'))
                 return song_entry
             
             logger.debug("get_current_song_entry: 索引超出范围")
             return None
             
         except Exception as e:
-            logger.error(f"获取当前歌曲条目失败: {e}")
+            logger.error("获取当前歌曲条目失败: %s", e)
             return None
     
     def update_current_song_state(self, **state_updates):
@@ -571,20 +726,24 @@ class PlaybackView:
                 if 'last_played' not in state_updates and any(k in state_updates for k in ['play_count']):
                     current_song["state"]["last_played"] = datetime.now().isoformat()
                 
-                # 保存更新后的播放列表
+                # 保存更新后的播放列表（延迟合并写盘）
                 current_playlist = self.playlist_manager.get_current_playlist()
                 if current_playlist:
                     self.playlist_manager.save_current_playlist(current_playlist)
                     
         except Exception as e:
-            logger.error(f"更新歌曲状态失败: {e}")
+            logger.error("更新歌曲状态失败: %s", e)
+    
+    def flush_current_playlist(self):
+        """立即写入播放列表管理器中尚未写盘的修改"""
+        self.playlist_manager.flush_pending_save()
     
     def update_current_song_info(self):
         """更新当前歌曲信息（从music_library获取详细信息）"""
         try:
-            # 使用播放列表组件获取当前歌曲信息
-            current_song = self.playlist_component.get_current_song_info()
-            logger.debug(f"从播放列表组件获取的当前歌曲: {current_song is not None}")
+            # 获取当前歌曲条目
+            current_song = self.get_current_song_entry()
+            logger.debug("获取的当前歌曲: %s", current_song is not None)
             
             if not current_song:
                 self.current_song_info = None
@@ -594,13 +753,19 @@ class PlaybackView:
             # 获取歌曲名称和信息
             song_info = current_song.get('info', {})
             song_name = current_song.get('name') or song_info.get('name')
-            logger.debug(f"歌曲名称: {song_name}")
+            logger.debug("歌曲名称: %s", song_name)
             
             if not song_name:
                 self.current_song_info = None
                 logger.debug("歌曲名称为空，设置为None")
                 return
             
+            # 同一首歌（同一信息字典）直接复用上次合并的结果
+            cached_name, cached_info, cached_value = self._song_info_cache
+            if cached_name == song_name and cached_info is song_info:
+                self.current_song_info = cached_value
+                return
+            
             # 从music_library获取详细信息（如果可用）
             music_library = getattr(self.app, 'music_library', None)
             if music_library:
@@ -608,27 +773,29 @@ class PlaybackView:
                 if detailed_info:
                     # 合并播放列表中的信息和音乐库中的详细信息
                     self.current_song_info = {**song_info, **detailed_info}
-                    logger.debug(f"合并音乐库信息，更新歌曲信息: {song_name}")
+                    logger.debug("合并音乐库信息，更新歌曲信息: %s", song_name)
                 else:
                     # 使用播放列表中的信息
                     self.current_song_info = song_info
-                    logger.debug(f"使用播放列表信息: {song_name}")
+                    logger.debug("使用播放列表信息: %s", song_name)
             else:
                 # 使用播放列表中的信息
                 self.current_song_info = song_info
                 logger.debug("music_library不可用，使用播放列表信息")
+            
+            self._song_info_cache = (song_name, song_info, self.current_song_info)
         
         except Exception as e:
-            logger.error(f"更新当前歌曲信息失败: {e}")
+            logger.error("更新当前歌曲信息失败: %s", e)
             self.current_song_info = None
     
     def refresh_playlist_display(self):
         """刷新播放列表显示 - 使用播放列表组件"""
         try:
-            if hasattr(self, 'playlist_component'):
+            if self.playlist_component:
                 self.playlist_component.refresh_display()
         except Exception as e:
-            logger.error(f"刷新播放列表显示失败: {e}")
+            logger.error("刷新播放列表显示失败: %s", e)
     
     
     def create_now_playing_section(self):
@@ -665,180 +832,263 @@ class PlaybackView:
             )
         )
         
-        self.now_playing_box.add(self.song_title_label)
-        self.now_playing_box.add(self.status_label)
+        self.now_playing_box.add(self.song_title_label, self.status_label)
     
     
     def start_ui_timer(self):
         """启动UI更新定时器"""
         logger.info("启动UI更新定时器")
-        self.update_ui()
+        self.update_ui(force=True)
         # 使用异步方式，在主线程中更新
         try:
-            if hasattr(self.app, 'add_background_task'):
-                logger.info("使用app.add_background_task启动UI更新")
-                # 创建协程并包装为可调用的函数
-                def start_task():
-                    import asyncio
-                    try:
-                        loop = asyncio.get_running_loop()
-                        loop.create_task(self.schedule_ui_update())
-                        logger.info("成功创建UI更新协程任务")
-                    except Exception as e:
-                        logger.error(f"创建协程任务失败: {e}")
-                
-                self.app.add_background_task(start_task)
-            else:
-                logger.warning("没有找到add_background_task方法，UI更新定时器无法启动")
+            self.app.add_background_task(self.schedule_ui_update())
         except Exception as e:
-            logger.error(f"启动UI更新定时器失败: {e}")
+            logger.error("启动UI更新定时器失败: %s", e)
     
     async def schedule_ui_update(self):
         """定时更新UI - 在主线程异步执行"""
         logger.info("开始UI更新定时器")
-        # iOS特殊处理：降低更新频率，避免卡顿
-        from ..platform_audio import is_ios
-        update_interval = 2.0 if is_ios() else 0.5  # iOS用2秒，其他平台0.5秒
-        logger.info(f"设置UI更新间隔: {update_interval}秒")
+        update_interval = self._ui_interval
+        logger.info("设置UI更新间隔: %s秒", update_interval)
         
+        self._ui_wake_event = asyncio.Event()
         while True:
-            await asyncio.sleep(update_interval)
+            # 定时轮询；播放状态变化时会被提前唤醒。未在播放时进度不变，放慢轮询；
+            # 用户正在拖动进度条时加快轮询，让界面及时反映跳转结果
+            if not self.playback_service.is_playing():
+                timeout = _IDLE_UI_POLL_INTERVAL
+            elif self.playback_control_component and self.playback_control_component.is_user_interacting():
+                timeout = update_interval / 2
+            else:
+                timeout = update_interval
+            try:
+                await asyncio.wait_for(self._ui_wake_event.wait(), timeout=timeout)
+            except asyncio.TimeoutError:
+                pass
+            self._ui_wake_event.clear()
             try:
                 # 只更新播放进度，避免触发列表更新
                 self.update_progress_only()
             except Exception as e:
-                logger.error(f"UI更新失败: {e}")
+                logger.error("UI更新失败: %s", e)
     
     def update_progress_only(self):
         """只更新播放进度，不更新列表等复杂UI组件"""
+        # 暂停/停止时进度不再变化：状态切换后刷新一次（用于检测自然播放结束），之后跳过
+        if not self._is_playing or self._is_paused:
+            if self._progress_idle:
+                return
+            self._progress_idle = True
         try:
-            # 使用播放控制组件来更新进度
-            if hasattr(self, 'playback_control_component') and self.playback_control_component:
-                self.playback_control_component.update_progress()
-            
-            # 更新歌词显示位置
+            # 每次刷新只向播放器查询一次位置和时长，供进度条、歌词和完成检测共用
             position = 0
             duration = 0
-            if hasattr(self, 'playback_control_component') and self.playback_control_component:
-                position = self.playback_control_component.get_current_position()
-                duration = self.playback_control_component.get_current_duration()
-            
-            if self.lyrics_component:
-                self.lyrics_component.update_lyrics_position(position)
+            control = self.playback_control_component
+            if control:
+                position = control.get_current_position()
+                duration = control.get_current_duration()
+            self._render_progress(position, duration)
             
             # 检测播放完成并自动播放下一曲的逻辑保持不变
             if duration > 0 and position > 0:
-                progress_ratio = position / duration
-                # iOS特殊处理：提高完成阈值，避免频繁触发
-                from ..platform_audio import is_ios
-                completion_threshold = 0.98 if is_ios() else 0.99
+                marks = self._completion_marks
+                if marks[0] != duration:
+                    marks = (duration, duration * self._completion_threshold, duration * 0.95)
+                    self._completion_marks = marks
                 
                 # 如果播放进度超过阈值，认为歌曲播放完成
-                if progress_ratio >= completion_threshold and not getattr(self, '_song_completed', False):
-                    logger.info(f"歌曲播放完成，进度: {progress_ratio:.1%}")
-                    self._song_completed = True  # 标记歌曲已完成
+                phase = self._playback_phase
+                if phase == _PlaybackPhase.PLAYING and position >= marks[1]:
+                    logger.info("歌曲播放完成，进度: %.1f%%", position * 100 / duration)
+                    self._playback_phase = _PlaybackPhase.COMPLETING  # 标记歌曲已完成
                     
                     # 立即停止UI更新避免后续的跳转警告
                     logger.info("歌曲完成，准备处理下一曲逻辑")
                     
-                    # 使用异步方式处理下一曲播放，避免阻塞UI
-                    try:
-                        if hasattr(self.app, 'add_background_task'):
-                            self.app.add_background_task(self._auto_play_next_song)
-                            logger.info("已添加自动播放任务到后台")
-                        else:
-                            # 备用方案：创建独立的异步任务
-                            import asyncio
-                            loop = asyncio.get_event_loop()
-                            loop.create_task(self._auto_play_next_song())
-                            logger.info("已创建独立的自动播放任务")
-                    except Exception as task_error:
-                        logger.error(f"创建自动播放任务失败: {task_error}")
-                        # 最后的备用方案：直接调用同步版本
+                    # 使用异步任务处理下一曲播放，避免阻塞UI；上一个自动播放任务未结束时不重复创建
+                    auto_next_task = self._auto_next_task
+                    if auto_next_task is not None and not auto_next_task.done():
+                        logger.debug("自动播放任务仍在执行，跳过")
+                    else:
                         try:
-                            import threading
-                            def run_auto_play():
-                                import asyncio
-                                asyncio.run(self._auto_play_next_song())
-                            thread = threading.Thread(target=run_auto_play, daemon=True)
-                            thread.start()
-                            logger.info("已在独立线程中启动自动播放")
-                        except Exception as thread_error:
-                            logger.error(f"线程启动自动播放也失败: {thread_error}")
+                            self._auto_next_task = asyncio.get_event_loop().create_task(
+                                self._auto_play_next_song()
+                            )
+                            logger.info("已创建自动播放任务")
+                        except Exception as task_error:
+                            logger.error("创建自动播放任务失败: %s", task_error)
                 # 重置播放完成标记（当位置明显减少时，比如重新开始播放或切换歌曲）
-                elif progress_ratio < 0.95 and getattr(self, '_song_completed', False):
+                elif phase == _PlaybackPhase.COMPLETING and position < marks[2]:
                     logger.debug("歌曲位置重置，清除播放完成标记")
-                    self._song_completed = False
+                    self._playback_phase = _PlaybackPhase.PLAYING
             
             # 更新播放状态（从播放服务获取实时状态）
-            is_playing = self.playback_service.is_playing()
-            is_paused = getattr(self.playback_service, 'current_song_state', {}).get('is_paused', False)
-            
-            if is_playing:
-                self.status_label.text = "播放中 🔊"
-                self.status_label.style.color = "#28a745"  # 绿色表示播放
-                # 更新播放控制组件的播放/暂停按钮
-                if hasattr(self, 'playback_control_component') and self.playback_control_component:
-                    self.playback_control_component.update_play_pause_button(True)
-            elif is_paused:
-                self.status_label.text = "暂停 ⏸"
-                self.status_label.style.color = "#ffc107"  # 黄色表示暂停
-                if hasattr(self, 'playback_control_component') and self.playback_control_component:
-                    self.playback_control_component.update_play_pause_button(False)
-            else:
-                self.status_label.text = "停止 ●"
-                self.status_label.style.color = "#6c757d"  # 灰色表示停止
-                if hasattr(self, 'playback_control_component') and self.playback_control_component:
-                    self.playback_control_component.update_play_pause_button(False)
+            self._render_play_state(self.playback_service.is_playing(), self._is_paused)
                 
         except Exception as e:
-            logger.error(f"更新播放进度失败: {e}")
+            logger.error("更新播放进度失败: %s", e)
+    
+    def _render_progress(self, position: float, duration: float):
+        """刷新进度条、时间和歌词位置"""
+        control = self.playback_control_component
+        if control:
+            control.update_progress(position, duration)
+        lyrics = self.lyrics_component
+        if lyrics:
+            lyrics.update_lyrics_position(position)
+    
+    def _render_play_state(self, is_playing: bool, is_paused: bool):
+        """刷新播放状态标签和播放/暂停按钮（状态未变化时跳过）"""
+        state = (is_playing, is_paused)
+        if state == self._last_play_state:
+            return
+        self._last_play_state = state
+        if is_playing:
+            self._set_status("播放中 🔊", "#28a745")  # 绿色表示播放
+        elif is_paused:
+            self._set_status("暂停 ⏸", "#ffc107")  # 黄色表示暂停
+        else:
+            self._set_status("停止 ●", "#6c757d")  # 灰色表示停止
+        if self.playback_control_component:
+            self.playback_control_component.update_play_pause_button(is_playing)
     
     async def _auto_play_next_song(self):
         """自动播放下一曲的内部方法 - 使用播放控制器"""
         try:
-            logger.info("进入自动播放下一曲方法")
+            logger.debug("进入自动播放下一曲方法")
             
             # 检查是否已经在切换歌曲
-            if hasattr(self, '_switching_song') and self._switching_song:
+            if self._switching_song:
                 logger.warning("正在手动切换歌曲，跳过自动播放")
                 return
                 
             await asyncio.sleep(0.2)  # 延迟稍长一点，确保播放状态稳定
             
-            # 使用播放控制器的自动播放逻辑
+            # 使用播放控制器的自动播放逻辑；播放成功时 play_music_file 已刷新过UI
+            self._needs_ui_refresh = True
             success = await self.playback_controller.auto_play_next_song()
             
             if success:
-                # 更新播放列表显示
-                if hasattr(self, 'playlist_component') and self.playlist_component:
-                    self.playlist_component.refresh_display()
-                # 更新UI显示
-                self.update_ui()
+                # 仅在播放回调未刷新UI时（如播放失败）补一次刷新，播放列表由 update_ui 按需更新
+                self._maybe_refresh_ui()
                 logger.info("自动播放下一曲成功")
             else:
                 logger.info("自动播放下一曲结束或失败")
                 
         except Exception as e:
-            logger.error(f"自动播放下一曲失败: {e}")
-            import traceback
-            logger.error(f"详细错误信息: {traceback.format_exc()}")
+            logger.error("自动播放下一曲失败: %s", e, exc_info=True)
     
-    def update_ui(self):
-        """更新UI显示"""
+    def _schedule_trailing_ui_update(self, delay: float):
+        """节流窗口结束后补一次刷新，合并短时间内的多次刷新请求"""
+        if self._trailing_ui_handle is not None:
+            return
         try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            return
+        self._trailing_ui_handle = loop.call_later(delay, self._run_trailing_ui_update)
+    
+    def _run_trailing_ui_update(self):
+        """执行延迟的UI刷新"""
+        self._trailing_ui_handle = None
+        self.update_ui()
+    
+    def _maybe_refresh_ui(self):
+        """存在未刷新的状态变化时执行一次UI刷新"""
+        if self._needs_ui_refresh:
+            self.update_ui(force=True)
+    
+    def _set_text(self, key: str, widget, value: str):
+        """仅在值变化时写入控件文本"""
+        if self._ui_cache.get(key) != value:
+            widget.text = value
+            self._ui_cache[key] = value
+    
+    def _set_style(self, key: str, widget, name: str, value):
+        """仅在值变化时写入控件样式属性"""
+        if self._ui_cache.get(key) != value:
+            setattr(widget.style, name, value)
+            self._ui_cache[key] = value
+    
+    def _set_status(self, text: str, color: str):
+        """更新状态标签文本和颜色（仅在变化时写入）"""
+        self._set_text('status', self.status_label, text)
+        self._set_style('status_color', self.status_label, 'color', color)
+    
+    def _on_service_state_changed(self, is_playing: bool, is_paused: bool):
+        """播放服务状态变化：记录状态，并在下一轮事件循环刷新一次UI"""
+        self._is_playing = is_playing
+        self._is_paused = is_paused
+        self._progress_idle = False
+        self._wake_ui_loop()
+        
+        if self._state_refresh_handle is None:
+            try:
+                loop = asyncio.get_running_loop()
+            except RuntimeError:
+                return
+            self._state_refresh_handle = loop.call_soon(self._refresh_after_state_change)
+    
+    def _refresh_after_state_change(self):
+        """播放状态变化后的UI刷新"""
+        self._state_refresh_handle = None
+        self.update_ui(force=True)
+    
+    def _wake_ui_loop(self):
+        """唤醒UI定时循环"""
+        if self._ui_wake_event is not None:
+            self._ui_wake_event.set()
+    
+    def update_ui(self, force: bool = False):
+        """更新UI显示（限制最高重绘频率，播放状态切换或 force 时立即更新）"""
+        try:
+            is_playing = self.playback_service.is_playing()
+            now = time.monotonic()
+            if (not force and is_playing == self._last_is_playing
+                    and now - self._last_ui_update < self._ui_min_interval):
+                self._schedule_trailing_ui_update(self._ui_min_interval - (now - self._last_ui_update))
+                return
+            if self._trailing_ui_handle is not None:
+                self._trailing_ui_handle.cancel()
+                self._trailing_ui_handle = None
+            
+            # 读取一次播放状态签名，与上次刷新相同时无需重绘
+            is_paused = self._is_paused
+            if self.playback_service.audio_player is not None:
+                position = self.playback_control_component.get_current_position()
+                duration = self.playback_control_component.get_current_duration()
+            else:
+                position = duration = 0
+            current_playlist = self.playlist_manager.get_current_playlist() or {}
+            songs = current_playlist.get('songs') or []
+            ui_sig = (is_playing, is_paused, current_playlist.get('current_index', 0),
+                      len(songs), id(songs), int(position), int(duration), self.play_mode,
+                      self.playlist_manager.change_version, self._song_info_version)
+            if not force and ui_sig == self._last_ui_sig:
+                return
+            self._last_ui_sig = ui_sig
+            
+            self._last_ui_update = now
+            self._last_is_playing = is_playing
+            
+            self._needs_ui_refresh = False
+            
+            # 开始新一次刷新，本次刷新内复用当前歌曲条目查找结果
+            self._ui_tick_id += 1
+            self._in_ui_tick = True
+            
             # 更新当前歌曲信息显示
             self.update_current_song_info()
             
             current_song = self.get_current_song_entry()
-            logger.debug(f"更新UI - 当前歌曲条目: {current_song is not None}")
-            logger.debug(f"更新UI - 当前歌曲信息: {self.current_song_info is not None}")
+            logger.debug("更新UI - 当前歌曲条目: %s", current_song is not None)
+            logger.debug("更新UI - 当前歌曲信息: %s", self.current_song_info is not None)
             
             if current_song and self.current_song_info:
                 song_info = self.current_song_info
                 
                 # 显示歌曲标题和艺术家信息
-                display_title = song_info.get('title', song_info.get('display_name', song_info.get('name', '未知歌曲')))
+                display_title = song_info.get('title') or song_info.get('display_name') or song_info.get('name') or '未知歌曲'
                 if display_title.endswith('.mp3'):
                     display_title = display_title[:-4]
                 
@@ -849,66 +1099,30 @@ class PlaybackView:
                 else:
                     new_title = display_title
                 
-                # 只有当标题真正改变时才更新（避免不必要的UI刷新）
-                if self.song_title_label.text != new_title:
-                    self.song_title_label.text = new_title
-                    logger.debug(f"更新歌曲标题: {new_title}")
+                self._set_text('song_title', self.song_title_label, new_title)
             else:
-                if self.song_title_label.text != "未选择歌曲":
-                    self.song_title_label.text = "未选择歌曲"
-                    logger.debug("设置为未选择歌曲")
+                self._set_text('song_title', self.song_title_label, "未选择歌曲")
             
-            # 更新播放状态（从播放服务获取实时状态）
-            is_playing = self.playback_service.is_playing()
-            is_paused = getattr(self.playback_service, 'current_song_state', {}).get('is_paused', False)
-            
-            if is_playing:
-                self.status_label.text = "播放中 🔊"
-                self.status_label.style.color = "#28a745"  # 绿色表示播放
-                # 更新播放控制组件的播放/暂停按钮
-                self.playback_control_component.update_play_pause_button(True)
-            elif is_paused:
-                self.status_label.text = "暂停 ⏸"
-                self.status_label.style.color = "#ffc107"  # 黄色表示暂停
-                self.playback_control_component.update_play_pause_button(False)
-            else:
-                self.status_label.text = "停止 ●"
-                self.status_label.style.color = "#6c757d"  # 灰色表示停止
-                self.playback_control_component.update_play_pause_button(False)
-            
-            # 更新播放进度 - 使用播放控制组件
-            if hasattr(self, 'playback_control_component') and self.playback_control_component:
-                self.playback_control_component.update_progress()
-                
-                # 获取位置信息用于更新歌词
-                position = self.playback_control_component.get_current_position()
-                
-                # 更新歌词显示位置  
-                if self.lyrics_component:
-                    self.lyrics_component.update_lyrics_position(position)
+            # 更新播放状态和播放进度
+            self._render_play_state(is_playing, is_paused)
+            self._render_progress(position, duration)
             
             # 更新音量显示（音量控制现在由播放控制组件处理）
             # 播放控制组件会自己处理音量显示更新
             
             # 更新播放列表 - 由播放列表组件自己处理
-            if hasattr(self, 'playlist_component') and self.playlist_component:
+            if self.playlist_component:
                 self.playlist_component.update_display()
             
             # 更新播放模式按钮状态
             # 更新播放控制组件的播放模式按钮
-            if hasattr(self, 'playback_control_component') and self.playback_control_component:
+            if self.playback_control_component:
                 self.playback_control_component.update_mode_buttons()
             
-            # 强制刷新UI（确保所有更改都被显示）
-            try:
-                if hasattr(self.app, 'main_window') and self.app.main_window:
-                    # 触发UI重绘
-                    pass
-            except Exception as refresh_error:
-                logger.debug(f"UI刷新失败（可忽略）: {refresh_error}")
-            
         except Exception as e:
-            logger.error(f"更新UI失败: {e}")
+            logger.error("更新UI失败: %s", e)
+        finally:
+            self._in_ui_tick = False
     
     async def download_and_play_song(self, song_name: str, song_info: Dict[str, Any]):
         """下载并播放歌曲"""
@@ -930,7 +1144,7 @@ class PlaybackView:
                     current_song = self.get_current_song_entry()
                     if current_song:
                         current_song["info"] = updated_info
-                        # 保存更新后的播放列表
+                        # 保存更新后的播放列表（与下面的状态更新合并写盘）
                         current_playlist = self.playlist_manager.get_current_playlist()
                         if current_playlist:
                             self.playlist_manager.save_current_playlist(current_playlist)
@@ -940,22 +1154,21 @@ class PlaybackView:
                         play_count=current_song["state"].get("play_count", 0) + 1
                     )
                 
-                # 立即更新UI显示歌曲信息
-                self.update_current_song_info()
-                self.update_ui()
+                # 立即更新UI显示歌曲信息（update_ui 会刷新当前歌曲信息）
+                self.update_ui(force=True)
                 
                 # 加载歌词
                 if self.lyrics_component:
-                    self.lyrics_component.load_lyrics_for_song(song_name)
+                    self._schedule_lyrics_load(song_name)
                 
                 self.show_message(f"下载并播放成功: {song_name}", "success")
-                logger.info(f"下载并开始播放: {song_name}")
+                logger.info("下载并开始播放: %s", song_name)
             else:
                 self.show_message(f"下载失败: {song_name}", "error")
-                logger.error(f"下载失败: {song_name}")
+                logger.error("下载失败: %s", song_name)
                 
         except Exception as e:
-            logger.error(f"下载并播放歌曲失败: {e}")
+            logger.error("下载并播放歌曲失败: %s", e)
             self.show_message(f"下载播放失败: {str(e)}", "error")
     
     # =================================================================
@@ -970,7 +1183,7 @@ class PlaybackView:
             music_files: 音乐文件列表
             start_index: 开始播放的索引
         """
-        logger.info(f"处理播放选中歌曲请求，文件数: {len(music_files)}, 开始索引: {start_index}")
+        logger.info("处理播放选中歌曲请求，文件数: %s, 开始索引: %s", len(music_files), start_index)
         try:
             # 创建新播放列表或清空当前播放列表
             if music_files:
@@ -988,7 +1201,8 @@ class PlaybackView:
                 
                 # 使用批量添加方法，一次性添加所有歌曲
                 added_count = self.playlist_component.add_songs_to_playlist_batch(music_files)
-                logger.info(f"批量添加完成，实际添加 {added_count} 首歌曲")
+                logger.info("批量添加完成，实际添加 %s 首歌曲", added_count)
+                self.app.add_background_task(self._prefetch_paths(music_files))
                 
                 # 设置播放索引
                 current_playlist = self.playlist_manager.get_current_playlist()
@@ -1002,9 +1216,9 @@ class PlaybackView:
                     target_song = music_files[start_index] if start_index < len(music_files) else music_files[0]
                     self.app.add_background_task(self.play_selected_song(target_song))
             
-            logger.info(f"处理播放选中歌曲请求完成，索引: {start_index}")
+            logger.info("处理播放选中歌曲请求完成，索引: %s", start_index)
             
         except Exception as e:
-            logger.error(f"处理播放选中歌曲请求失败: {e}")
+            logger.error("处理播放选中歌曲请求失败: %s", e)
             self.show_message(f"播放失败: {str(e)}", "error")
     
\ No newline at end of file
@@ -0,0 +1,57 @@
+"""
+配置管理器测试：播放列表文件保存
+"""
+import json
+import os
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+from unittest.mock import patch
+
+# 添加src目录到Python路径
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from nextcloud_music_player.config_manager import ConfigManager
+
+
+class TestSavePlaylists(unittest.TestCase):
+    """播放列表保存测试"""
+
+    def setUp(self):
+        self._tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(self._tmp.cleanup)
+        self.config_dir = Path(self._tmp.name)
+        with patch.object(ConfigManager, '_get_config_directory', return_value=self.config_dir):
+            self.config_manager = ConfigManager()
+
+    def test_save_writes_file_without_leftover_temp_files(self):
+        """保存成功后写入文件且不留下临时文件"""
+        data = {"playlists": [{"id": 1, "name": "测试列表"}], "current_playlist_id": 1, "next_id": 2}
+        self.assertTrue(self.config_manager.save_playlists(data))
+
+        with open(self.config_dir / "playlists.json", 'r', encoding='utf-8') as f:
+            self.assertEqual(json.load(f)["playlists"][0]["name"], "测试列表")
+        self.assertEqual(list(self.config_dir.glob("*.tmp")), [])
+
+    @unittest.skipIf(os.name != 'posix', "仅在 POSIX 系统上检查文件权限")
+    def test_save_keeps_file_mode(self):
+        """保存后保留播放列表文件原有的权限"""
+        data = {"playlists": [], "current_playlist_id": None, "next_id": 1}
+        playlist_file = self.config_dir / "playlists.json"
+        self.assertTrue(self.config_manager.save_playlists(data))
+        os.chmod(playlist_file, 0o644)
+
+        self.assertTrue(self.config_manager.save_playlists(data))
+        self.assertEqual(os.stat(playlist_file).st_mode & 0o777, 0o644)
+
+    def test_save_failure_returns_false(self):
+        """写入失败时返回 False 并清理临时文件"""
+        data = {"playlists": [], "current_playlist_id": None, "next_id": 1}
+        with patch('nextcloud_music_player.config_manager.os.replace', side_effect=OSError("disk full")):
+            self.assertFalse(self.config_manager.save_playlists(data))
+        self.assertEqual(list(self.config_dir.glob("*.tmp")), [])
+
+
+if __name__ == '__main__':
+    unittest.main()
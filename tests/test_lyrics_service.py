@@ -0,0 +1,86 @@
+"""
+歌词服务测试：按播放位置查找当前歌词行与歌词缓存
+"""
+import os
+import sys
+import tempfile
+import unittest
+
+# 添加src目录到Python路径
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from nextcloud_music_player.services.lyrics_service import LyricsService, LYRICS_CACHE_SIZE
+
+LRC = """[00:01.00]第一行
+[00:05.00]第二行
+[00:10.00]第三行
+[00:20.00]第四行
+"""
+
+
+class TestCurrentLyricLine(unittest.TestCase):
+    """当前歌词行测试"""
+
+    def setUp(self):
+        self.service = LyricsService()
+        lines, _ = self.service.parse_lrc_content(LRC)
+        self.service.current_lyrics = {'lines': lines}
+
+    def _text_at(self, position):
+        line = self.service.get_current_lyric_line(position)
+        return line.text if line else None
+
+    def test_before_first_line(self):
+        """第一行之前没有当前歌词"""
+        self.assertIsNone(self._text_at(0.5))
+
+    def test_forward(self):
+        """播放位置前进时依次返回各行"""
+        self.assertEqual(self._text_at(1.0), "第一行")
+        self.assertEqual(self._text_at(6.0), "第二行")
+        self.assertEqual(self._text_at(6.5), "第二行")
+        self.assertEqual(self._text_at(25.0), "第四行")
+
+    def test_backward_seek(self):
+        """向前跳转后返回跳转位置对应的歌词"""
+        self.assertEqual(self._text_at(21.0), "第四行")
+        self.assertEqual(self._text_at(6.0), "第二行")
+        self.assertIsNone(self._text_at(0.0))
+        self.assertEqual(self._text_at(10.0), "第三行")
+
+    def test_new_lyrics_reset_cursor(self):
+        """换歌后从新歌词的开头查找"""
+        self.assertEqual(self._text_at(25.0), "第四行")
+        lines, _ = self.service.parse_lrc_content("[00:30.00]新歌第一行\n[00:40.00]新歌第二行\n")
+        self.service.current_lyrics = {'lines': lines}
+        self.assertIsNone(self._text_at(25.0))
+        self.assertEqual(self._text_at(35.0), "新歌第一行")
+
+
+class TestLyricsCache(unittest.TestCase):
+    """歌词缓存测试"""
+
+    def setUp(self):
+        self.service = LyricsService()
+
+    def test_read_file_does_not_touch_cache(self):
+        """读取歌词文件只返回数据，不写入缓存"""
+        with tempfile.NamedTemporaryFile('w', encoding='utf-8', suffix='.lrc', delete=False) as f:
+            f.write(LRC)
+        self.addCleanup(os.remove, f.name)
+
+        lyrics_data = self.service._read_lyrics_file("song.mp3", f.name)
+        self.assertEqual(len(lyrics_data['lines']), 4)
+        self.assertEqual(self.service.lyrics_cache, {})
+
+    def test_cache_evicts_oldest_entry(self):
+        """缓存超出上限时淘汰最早加入的条目"""
+        for i in range(LYRICS_CACHE_SIZE + 1):
+            self.service.cache_lyrics(f"song{i}.mp3", {'lines': []})
+        self.assertEqual(len(self.service.lyrics_cache), LYRICS_CACHE_SIZE)
+        self.assertNotIn("song0.mp3", self.service.lyrics_cache)
+        self.assertIn(f"song{LYRICS_CACHE_SIZE}.mp3", self.service.lyrics_cache)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,46 @@
+"""
+音乐库测试：music_list.json 的按需重新加载
+"""
+import json
+import os
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+from unittest.mock import patch
+
+# 添加src目录到Python路径
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from nextcloud_music_player.config_manager import ConfigManager
+from nextcloud_music_player.music_library import MusicLibrary
+
+
+class TestMusicListReload(unittest.TestCase):
+    """歌曲信息查找未命中时的重新加载测试"""
+
+    def setUp(self):
+        self._tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(self._tmp.cleanup)
+        with patch.object(ConfigManager, '_get_config_directory', return_value=Path(self._tmp.name)):
+            self.library = MusicLibrary()
+        self.library.songs = {'a.mp3': {'name': 'a.mp3'}}
+        self.library.save_music_list()
+
+    def test_miss_does_not_reload_unchanged_file(self):
+        """文件未修改时，查找不到的歌曲不会触发重新解析"""
+        with patch.object(self.library, 'load_music_list') as load:
+            self.assertIsNone(self.library.get_song_info('missing.mp3'))
+            self.assertIsNone(self.library.get_song_info('missing.mp3'))
+        load.assert_not_called()
+
+    def test_miss_reloads_externally_modified_file(self):
+        """文件在外部被修改后，查找不到的歌曲会重新加载"""
+        with open(self.library.music_list_file, 'w', encoding='utf-8') as f:
+            json.dump({'music_list': {'a.mp3': {'name': 'a.mp3'}, 'b.mp3': {'name': 'b.mp3'}}}, f)
+
+        self.assertEqual(self.library.get_song_info('b.mp3'), {'name': 'b.mp3'})
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,53 @@
+"""
+播放控制器测试：随机播放顺序
+"""
+import os
+import sys
+import unittest
+
+# 添加src目录到Python路径
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from nextcloud_music_player.services.playback_controller import PlaybackController, PlayMode
+
+
+class TestShuffleOrder(unittest.TestCase):
+    """随机播放顺序测试"""
+
+    def setUp(self):
+        self.controller = PlaybackController(playback_service=None, playlist_manager=None)
+        self.controller.set_play_mode(PlayMode.SHUFFLE)
+
+    def test_visits_every_song_before_repeating(self):
+        """一轮随机播放中每首歌恰好播放一次，之后回到起点"""
+        total = 20
+        index = 3
+        visited = [index]
+        for _ in range(total - 1):
+            index = self.controller._calculate_next_index(index, total)
+            visited.append(index)
+
+        self.assertEqual(sorted(visited), list(range(total)))
+        self.assertEqual(self.controller._calculate_next_index(index, total), visited[0])
+
+    def test_previous_reverses_next(self):
+        """上一首回到前进之前的歌曲"""
+        total = 10
+        for index in range(total):
+            next_index = self.controller._calculate_next_index(index, total)
+            self.assertEqual(self.controller._calculate_previous_index(next_index, total), index)
+
+    def test_reshuffles_when_song_count_changes(self):
+        """歌曲数变化后仍然覆盖全部歌曲"""
+        self.controller._calculate_next_index(0, 5)
+        total = 8
+        index = 0
+        visited = {index}
+        for _ in range(total - 1):
+            index = self.controller._calculate_next_index(index, total)
+            visited.add(index)
+        self.assertEqual(visited, set(range(total)))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,110 @@
+"""
+播放列表管理器测试：延迟写盘与退出时写回
+"""
+import asyncio
+import json
+import os
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+from unittest.mock import patch
+
+# 添加src目录到Python路径
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from nextcloud_music_player.config_manager import ConfigManager
+from nextcloud_music_player.services.playlist_manager import PlaylistManager
+
+
+class TestPlaylistManagerSave(unittest.TestCase):
+    """播放列表保存测试"""
+
+    def setUp(self):
+        self._tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(self._tmp.cleanup)
+        with patch.object(ConfigManager, '_get_config_directory', return_value=Path(self._tmp.name)):
+            self.config_manager = ConfigManager()
+        self.manager = PlaylistManager(self.config_manager)
+        self.playlist_file = Path(self._tmp.name) / "playlists.json"
+
+    def _read_playlists(self):
+        with open(self.playlist_file, 'r', encoding='utf-8') as f:
+            return json.load(f)
+
+    def test_save_is_debounced_in_event_loop(self):
+        """事件循环中的保存会延迟写盘"""
+        async def run():
+            playlist = self.manager.create_empty_playlist("测试列表")
+            playlist["current_index"] = 3
+            self.manager.save_current_playlist(playlist)
+            return self.playlist_file.exists() and self._read_playlists().get("playlists")
+
+        self.assertFalse(asyncio.run(run()))
+
+    def test_flush_on_exit_reaches_disk(self):
+        """退出时同步写回尚未写盘的修改"""
+        async def run():
+            playlist = self.manager.create_empty_playlist("测试列表")
+            playlist["current_index"] = 3
+            self.manager.save_current_playlist(playlist)
+            # 与 on_app_exit 相同：在事件循环仍在运行时同步写入
+            self.manager.flush_pending_save()
+
+        asyncio.run(run())
+        playlists = self._read_playlists()["playlists"]
+        self.assertEqual(len(playlists), 1)
+        self.assertEqual(playlists[0]["name"], "测试列表")
+        self.assertEqual(playlists[0]["current_index"], 3)
+
+    def test_save_without_event_loop_writes_immediately(self):
+        """没有事件循环时立即写盘"""
+        playlist = self.manager.create_empty_playlist("测试列表")
+        playlist["current_index"] = 2
+        self.manager.save_current_playlist(playlist)
+        self.assertEqual(self._read_playlists()["playlists"][0]["current_index"], 2)
+
+    def test_failed_write_is_retried_on_flush(self):
+        """写入失败后修改仍视为未保存，退出时的 flush 会重新写入"""
+        playlist = self.manager.create_empty_playlist("测试列表")
+        playlist["current_index"] = 4
+        with patch.object(self.config_manager, 'save_playlists_snapshot', return_value=False):
+            self.manager.save_current_playlist(playlist)
+        self.assertEqual(self._read_playlists()["playlists"][0]["current_index"], 0)
+
+        self.manager.flush_pending_save()
+        self.assertEqual(self._read_playlists()["playlists"][0]["current_index"], 4)
+
+
+class TestPlaylistManagerNameIndex(unittest.TestCase):
+    """歌曲名索引测试"""
+
+    def setUp(self):
+        self._tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(self._tmp.cleanup)
+        with patch.object(ConfigManager, '_get_config_directory', return_value=Path(self._tmp.name)):
+            config_manager = ConfigManager()
+        self.manager = PlaylistManager(config_manager)
+        self.manager.create_empty_playlist("测试列表")
+        self.manager.add_songs_to_current_playlist_batch([{'name': 'a.mp3'}, {'name': 'b.mp3'}])
+
+    def test_in_place_replacement_refreshes_index(self):
+        """原地替换歌曲（列表长度不变）后按新歌曲名查找"""
+        self.assertTrue(self.manager.update_song_state('b.mp3', {'is_favorite': True}))
+
+        playlist = self.manager.get_current_playlist()
+        playlist['songs'][1] = {'name': 'c.mp3', 'info': {'name': 'c.mp3'}, 'state': {}}
+        self.manager.save_current_playlist(playlist)
+
+        self.assertFalse(self.manager.update_song_state('b.mp3', {'is_favorite': True}))
+        self.assertTrue(self.manager.update_song_state('c.mp3', {'is_favorite': True}))
+
+    def test_change_version_increases_on_save(self):
+        """保存播放列表时修改计数递增"""
+        version = self.manager.change_version
+        self.manager.update_song_state('a.mp3', {'play_count': 1})
+        self.assertGreater(self.manager.change_version, version)
+
+
+if __name__ == '__main__':
+    unittest.main()